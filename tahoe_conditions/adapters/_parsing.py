@@ -0,0 +1,69 @@
+"""Shared HTML parsing helpers for adapter modules."""
+
+import re
+import threading
+from typing import Optional
+
+import lxml.html
+
+# Optional: RE2's DFA engine runs alternation-heavy patterns in linear
+# time, which is exactly the shape of the fused field scanners. Falls
+# back to the stdlib engine when google-re2 isn't installed (it is in
+# the "speed" extra).
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+# Parser objects are reusable but not safe to share across threads, so
+# keep one per thread instead of constructing one per parse call.
+_local = threading.local()
+
+
+def _get_parser() -> lxml.html.HTMLParser:
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = _local.parser = lxml.html.HTMLParser(recover=True)
+    return parser
+
+
+def parse_html(html: str | bytes) -> lxml.html.HtmlElement:
+    """Parse HTML into an lxml tree, reusing this thread's parser.
+
+    Accepts bytes as well as str; raw response bodies can be handed to
+    lxml directly, letting its C-level charset detection skip a Python
+    decode pass.
+    """
+    return lxml.html.fromstring(html, parser=_get_parser())
+
+
+def _search_near(
+    text: str, keyword: str, rx: re.Pattern, before: int = 20, after: int = 40
+) -> Optional[re.Match]:
+    """Search for a pattern only in small windows around a keyword.
+
+    str.find locates each keyword occurrence at C speed; the regex then
+    scans tens of characters instead of the whole page.
+    """
+    i = text.find(keyword)
+    while i != -1:
+        match = rx.search(text, max(0, i - before), i + after)
+        if match:
+            return match
+        i = text.find(keyword, i + 1)
+    return None
+
+
+def compile_scan(pattern: str) -> "re.Pattern":
+    """Compile a fused alternation pattern, preferring RE2 when available.
+
+    The scanners use no backrefs or lookaround, so they compile under
+    both engines; if RE2 still rejects one, fall back to stdlib re.
+    """
+    if HAS_RE2:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
@@ -1,13 +1,25 @@
 """Base adapter interface for resort condition parsers."""
 
+import hashlib
 import re
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from tahoe_conditions.models import Operations, Snow
 
+if TYPE_CHECKING:
+    import lxml.html
+
+# Single value with optional range high end; one search handles both
+# "6"" and "6-8""
+_INCHES_RE = re.compile(r"(\d+(?:\.\d+)?)(?:\s*[-–]\s*(\d+(?:\.\d+)?))?")
+
+# Bound on memoized parse results per adapter instance
+_PARSE_CACHE_MAX = 64
+
 
 @dataclass
 class ParseResult:
@@ -22,19 +34,55 @@ class ParseResult:
 class BaseAdapter(ABC):
     """Base class for resort condition adapters."""
 
+    def __init__(self) -> None:
+        # Keyed by content hash; see parse_cached
+        self._parse_cache: OrderedDict[bytes, ParseResult] = OrderedDict()
+
     @abstractmethod
-    def parse(self, html: str) -> ParseResult:
+    def parse(
+        self,
+        html: str,
+        tree: Optional["lxml.html.HtmlElement"] = None,
+    ) -> ParseResult:
         """
         Parse HTML content and extract conditions.
 
         Args:
             html: Raw HTML content from resort conditions page
+            tree: Optional prebuilt lxml tree for the same content. Callers
+                that try several adapters on one page can parse the DOM once
+                and pass it to each attempt; adapters that work from the DOM
+                use it instead of re-parsing html.
 
         Returns:
             ParseResult with extracted data
         """
         pass
 
+    def parse_cached(
+        self,
+        html: str,
+        tree: Optional["lxml.html.HtmlElement"] = None,
+    ) -> ParseResult:
+        """Parse with a small content-hash memo in front of parse().
+
+        Retries and overlapping schedules can hand the same page to the
+        same adapter; hashing the content is far cheaper than the parse
+        pipeline. Cached results are shared objects and callers treat
+        ParseResult as read-only, so returning the same instance is safe.
+        """
+        key = hashlib.blake2b(html.encode(), digest_size=16).digest()
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            return cached
+
+        result = self.parse(html, tree)
+        self._parse_cache[key] = result
+        if len(self._parse_cache) > _PARSE_CACHE_MAX:
+            self._parse_cache.popitem(last=False)
+        return result
+
     # ========== Utility Methods ==========
 
     @staticmethod
@@ -78,17 +126,14 @@ class BaseAdapter(ABC):
 
         text = text.strip().lower()
 
-        # Handle range like "6-8"" - take the average
-        range_match = re.search(r"(\d+(?:\.\d+)?)\s*[-–]\s*(\d+(?:\.\d+)?)", text)
-        if range_match:
-            low = float(range_match.group(1))
-            high = float(range_match.group(2))
-            return (low + high) / 2
-
-        # Single value
-        match = re.search(r"(\d+(?:\.\d+)?)\s*(?:\"|in|inches?)?", text)
+        # One pass: ranges like "6-8"" average, single values pass through
+        match = _INCHES_RE.search(text)
         if match:
-            return float(match.group(1))
+            low_str, high_str = match.groups()
+            low = float(low_str)
+            if high_str:
+                return (low + float(high_str)) / 2
+            return low
 
         return None
 
@@ -101,9 +146,9 @@ class BaseAdapter(ABC):
         text = text.strip().lower()
 
         # Check negative phrases first (order matters)
-        if any(phrase in text for phrase in ["not operating", "closed", "not open"]):
+        if "not operating" in text or "closed" in text or "not open" in text:
             return False
-        if any(word in text for word in ["open", "yes", "operating"]):
+        if "open" in text or "yes" in text or "operating" in text:
             return True
 
         return None
@@ -1,15 +1,35 @@
 """Adapter for Boreal Mountain Resort and Soda Springs."""
 
 import logging
-import re
+from typing import Optional
 
-from bs4 import BeautifulSoup
+import lxml.html
 
+from tahoe_conditions.adapters._parsing import compile_scan, parse_html
 from tahoe_conditions.adapters.base import BaseAdapter, ParseResult
 from tahoe_conditions.models import Operations, Snow
 
 logger = logging.getLogger(__name__)
 
+# All field patterns fused into one alternation so a single finditer pass
+# covers the whole page text instead of one scan per field. Each branch ends
+# with a uniquely named group; dispatch on match.lastgroup.
+# Boreal typically shows "X/Y Lifts" or "Lifts Open: X of Y".
+_COMBINED_RE = compile_scan(
+    r"(?P<lo>\d+)\s*/\s*(?P<lt>\d+)\s*lifts?"
+    r"|lifts?\s*(?:open)?[:\s]*(?P<lo2>\d+)\s*(?:of|/)\s*(?P<lt2>\d+)"
+    r"|(?P<lo3>\d+)\s*lifts?\s*open"
+    r"|(?P<to>\d+)\s*/\s*(?P<tt>\d+)\s*(?:trails?|runs?|terrain)"
+    r"|(?:trails?|runs?|terrain)\s*(?:open)?[:\s]*(?P<to2>\d+)\s*(?:of|/)\s*(?P<tt2>\d+)"
+    r"|(?P<to3>\d+)\s*(?:trails?|runs?)\s*open"
+    r"|(?:24\s*(?:hr|hour)|new\s*snow|overnight|last\s*24)[:\s]*(?P<s24>\d+(?:\.\d+)?)\s*(?:in|\")"
+    r"|(?P<s24b>\d+(?:\.\d+)?)\s*(?:in|\")?\s*(?:new|fresh)"
+    r"|(?:48\s*(?:hr|hour)|last\s*48)[:\s]*(?P<s48>\d+(?:\.\d+)?)\s*(?:in|\")"
+    r"|(?:base|mid\s*mtn|summit)[:\s]*(?P<base>\d+(?:\.\d+)?)\s*(?:in|\")"
+    r"|snow\s*(?:depth|base)[:\s]*(?P<base2>\d+(?:\.\d+)?)"
+    r"|(?:season|ytd|year)[:\s]*(?P<season>\d+(?:\.\d+)?)\s*(?:in|\")"
+)
+
 
 class BorealAdapter(BaseAdapter):
     """
@@ -19,87 +39,55 @@ class BorealAdapter(BaseAdapter):
     look for lift/trail counts and snow data in rendered text.
     """
 
-    def parse(self, html: str) -> ParseResult:
+    def parse(
+        self,
+        html: str,
+        tree: Optional["lxml.html.HtmlElement"] = None,
+    ) -> ParseResult:
         result = ParseResult()
         ops = Operations()
         snow = Snow()
 
         try:
-            soup = BeautifulSoup(html, "lxml")
-            text = soup.get_text(separator=" ")
-            text = re.sub(r"\s+", " ", text)
-
-            # === LIFTS ===
-            # Boreal typically shows "X/Y Lifts" or "Lifts Open: X of Y"
-            lift_patterns = [
-                r"(\d+)\s*/\s*(\d+)\s*lifts?",
-                r"lifts?\s*(?:open)?[:\s]*(\d+)\s*(?:of|/)\s*(\d+)",
-                r"(\d+)\s*lifts?\s*open",  # Just open count
-            ]
-            for pattern in lift_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    ops.lifts_open = int(match.group(1))
-                    if match.lastindex >= 2:
-                        ops.lifts_total = int(match.group(2))
-                    break
-
-            # === TRAILS ===
-            trail_patterns = [
-                r"(\d+)\s*/\s*(\d+)\s*(?:trails?|runs?|terrain)",
-                r"(?:trails?|runs?|terrain)\s*(?:open)?[:\s]*(\d+)\s*(?:of|/)\s*(\d+)",
-                r"(\d+)\s*(?:trails?|runs?)\s*open",
-            ]
-            for pattern in trail_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    ops.trails_open = int(match.group(1))
-                    if match.lastindex >= 2:
-                        ops.trails_total = int(match.group(2))
-                    break
-
-            # === SNOW DATA ===
-            # New snow (24h, 48h, or generic "new snow")
-            new_snow_patterns = [
-                r"(?:24\s*(?:hr|hour)|new\s*snow|overnight|last\s*24)[:\s]*(\d+(?:\.\d+)?)\s*(?:in|\")",
-                r"(\d+(?:\.\d+)?)\s*(?:in|\")?\s*(?:new|fresh)",
-            ]
-            for pattern in new_snow_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    snow.new_snow_24h_in = float(match.group(1))
-                    break
-
-            # 48h snow
-            snow_48h_match = re.search(
-                r"(?:48\s*(?:hr|hour)|last\s*48)[:\s]*(\d+(?:\.\d+)?)\s*(?:in|\")",
-                text, re.IGNORECASE
-            )
-            if snow_48h_match:
-                snow.new_snow_48h_in = float(snow_48h_match.group(1))
-
-            # Base depth
-            base_patterns = [
-                r"(?:base|mid\s*mtn|summit)[:\s]*(\d+(?:\.\d+)?)\s*(?:in|\")",
-                r"snow\s*(?:depth|base)[:\s]*(\d+(?:\.\d+)?)",
-            ]
-            for pattern in base_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    snow.base_depth_in = float(match.group(1))
-                    break
-
-            # Season total
-            season_match = re.search(
-                r"(?:season|ytd|year)[:\s]*(\d+(?:\.\d+)?)\s*(?:in|\")",
-                text, re.IGNORECASE
-            )
-            if season_match:
-                snow.season_total_in = float(season_match.group(1))
+            # This adapter only needs the page text, so parse with raw lxml
+            # and skip BeautifulSoup's per-node Python wrappers entirely
+            root = tree if tree is not None else parse_html(html)
+            # Lowercase once so the patterns can skip re.IGNORECASE, which
+            # defeats SRE's literal-prefix fast paths
+            text = " ".join(" ".join(root.itertext()).split()).lower()
+
+            # === LIFTS / TRAILS / SNOW DATA ===
+            # Single pass over the text; first hit per field wins
+            for m in _COMBINED_RE.finditer(text):
+                group = m.lastgroup
+                if group == "lt" and ops.lifts_open is None:
+                    ops.lifts_open = int(m.group("lo"))
+                    ops.lifts_total = int(m.group("lt"))
+                elif group == "lt2" and ops.lifts_open is None:
+                    ops.lifts_open = int(m.group("lo2"))
+                    ops.lifts_total = int(m.group("lt2"))
+                elif group == "lo3" and ops.lifts_open is None:
+                    ops.lifts_open = int(m.group("lo3"))
+                elif group == "tt" and ops.trails_open is None:
+                    ops.trails_open = int(m.group("to"))
+                    ops.trails_total = int(m.group("tt"))
+                elif group == "tt2" and ops.trails_open is None:
+                    ops.trails_open = int(m.group("to2"))
+                    ops.trails_total = int(m.group("tt2"))
+                elif group == "to3" and ops.trails_open is None:
+                    ops.trails_open = int(m.group("to3"))
+                elif group in ("s24", "s24b") and snow.new_snow_24h_in is None:
+                    snow.new_snow_24h_in = float(m.group(group))
+                elif group == "s48" and snow.new_snow_48h_in is None:
+                    snow.new_snow_48h_in = float(m.group(group))
+                elif group in ("base", "base2") and snow.base_depth_in is None:
+                    snow.base_depth_in = float(m.group(group))
+                elif group == "season" and snow.season_total_in is None:
+                    snow.season_total_in = float(m.group(group))
 
             # === OPEN STATUS ===
             # Check for explicit open/closed status
-            if "closed for season" in text.lower() or "not operating" in text.lower():
+            if "closed for season" in text or "not operating" in text:
                 ops.open_flag = False
             elif ops.lifts_open is not None:
                 ops.open_flag = ops.lifts_open > 0
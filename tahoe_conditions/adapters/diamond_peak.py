@@ -2,15 +2,45 @@
 
 import logging
 import re
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from bs4 import BeautifulSoup
 
+from tahoe_conditions.adapters._parsing import _search_near
 from tahoe_conditions.adapters.base import BaseAdapter, ParseResult
 from tahoe_conditions.models import Operations, Snow
 
+if TYPE_CHECKING:
+    import lxml.html
+
 logger = logging.getLogger(__name__)
 
+# Precompiled snow patterns - built once at import time. The page text is
+# lowercased before matching so the patterns skip re.IGNORECASE.
+_SNOW_24H_PATTERNS = (
+    re.compile(r"(\d+)\s*(?:inches?|\")\s*24\s*h"),
+    re.compile(r"24\s*h(?:our)?s?[:\s]*(\d+)"),
+)
+
+_OVERNIGHT_PATTERNS = (
+    re.compile(r"(\d+)\s*(?:inches?|\")\s*overnight"),
+    re.compile(r"overnight[:\s]*(\d+)"),
+)
+
+_BASE_RE = re.compile(r"base[:\s]*(\d+)\s*(?:inches?|\")")
+_PEAK_RE = re.compile(r"peak[:\s]*(\d+)\s*(?:inches?|\")")
+_SEASON_RE = re.compile(r"season[:\s]*(\d+)\s*(?:inches?|\")")
+
+# Lift row labels contain one of these words; matched against the
+# original-cased label text, so no IGNORECASE needed
+_LIFT_WORD_RE = re.compile(r"Lift|Chair|Powerline|Express")
+
+# Storm total as 48h proxy
+_STORM_PATTERNS = (
+    re.compile(r"storm\s*(?:total)?[:\s]*(\d+)\s*(?:inches?|\")"),
+    re.compile(r"(\d+)\s*(?:inches?|\")\s*storm\s*(?:total)?"),
+)
+
 
 class DiamondPeakAdapter(BaseAdapter):
     """
@@ -23,14 +53,20 @@ class DiamondPeakAdapter(BaseAdapter):
     - conditions__status = status text
     """
 
-    def parse(self, html: str) -> ParseResult:
+    def parse(
+        self,
+        html: str,
+        tree: Optional["lxml.html.HtmlElement"] = None,
+    ) -> ParseResult:
         result = ParseResult()
         ops = Operations()
         snow = Snow()
 
         try:
             soup = BeautifulSoup(html, "lxml")
-            text = soup.get_text(separator=" ")
+            # Lowercase once; all the free-text patterns match against this.
+            # DOM class and label checks below stay case-specific.
+            text_lower = soup.get_text(separator=" ").lower()
 
             # === LIFTS ===
             # Lifts are in rows with class "conditions__row--header" containing "Lift" or "Chair"
@@ -45,7 +81,7 @@ class DiamondPeakAdapter(BaseAdapter):
                     label_text = label.get_text().strip()
                     status_text = status.get_text().strip().lower()
                     # Check if this is a lift (contains "Lift", "Chair", or "Powerline")
-                    if any(word in label_text for word in ["Lift", "Chair", "Powerline", "Express"]):
+                    if _LIFT_WORD_RE.search(label_text):
                         lifts_total += 1
                         if status_text in ["open", "groomed"]:
                             lifts_open += 1
@@ -55,76 +91,72 @@ class DiamondPeakAdapter(BaseAdapter):
                 ops.lifts_total = lifts_total
 
             # === TRAILS ===
-            # Trails are in non-header rows with open/groomed/closed classes
-            # Count rows that are NOT headers and NOT terrain parks
-            trail_rows = soup.find_all(class_=re.compile(r"conditions__row--(?:open|groomed|closed)"))
-            trails_open = 0
-            trails_total = 0
-
-            for row in trail_rows:
-                classes = row.get("class", [])
-                # Skip if this is a header row (lift)
-                if "conditions__row--header" in classes:
-                    continue
-                # Skip terrain parks
-                label = row.find(class_="conditions__label")
-                if label and "Village" in label.get_text():
-                    continue  # Skip terrain park items
-
-                trails_total += 1
-                if "conditions__row--open" in classes or "conditions__row--groomed" in classes:
-                    trails_open += 1
+            # Trails are in non-header rows with open/groomed/closed classes.
+            # soupsieve compiles the selectors once and walks the tree in C,
+            # unlike find_all(class_=re.compile(...)) which runs a Python
+            # regex against every element. One select per status bucket means
+            # each row's status is implied by which select returned it, so no
+            # per-row class-list checks; :not() drops header (lift) rows in
+            # the same pass.
+            open_rows = soup.select(
+                ".conditions__row--open:not(.conditions__row--header), "
+                ".conditions__row--groomed:not(.conditions__row--header)"
+            )
+            closed_rows = soup.select(
+                ".conditions__row--closed:not(.conditions__row--header)"
+            )
+            trails_open = self._count_trail_rows(open_rows)
+            trails_total = trails_open + self._count_trail_rows(closed_rows)
 
             if trails_total > 0:
                 ops.trails_open = trails_open
                 ops.trails_total = trails_total
 
             # === SNOW DATA ===
-            # Look for patterns in the page text
-            snow.new_snow_24h_in = self._extract_snow_value(text,
-                r"(\d+)\s*(?:Inches?|\")\s*24\s*H",
-                r"24\s*[Hh](?:our)?[s]?[:\s]*(\d+)")
+            # Locate anchor keywords with str.find (C-level substring
+            # search), then run each regex only on a small window around
+            # the keyword instead of the full page text.
+            snow.new_snow_24h_in = self._extract_snow_value(
+                text_lower, "24", *_SNOW_24H_PATTERNS
+            )
 
             # Try overnight as 24h fallback
             if snow.new_snow_24h_in is None:
-                overnight = self._extract_snow_value(text,
-                    r"(\d+)\s*(?:Inches?|\")\s*overnight",
-                    r"overnight[:\s]*(\d+)")
+                overnight = self._extract_snow_value(
+                    text_lower, "overnight", *_OVERNIGHT_PATTERNS
+                )
                 if overnight is not None:
                     snow.new_snow_24h_in = overnight
 
             # Base depth
-            base_match = re.search(r"base[:\s]*(\d+)\s*(?:Inches?|\")", text, re.IGNORECASE)
+            base_match = _search_near(text_lower, "base", _BASE_RE)
             if base_match:
-                snow.base_depth_in = float(base_match.group(1))
+                snow.base_depth_in = int(base_match.group(1))
 
             # Also check for "Peak: X Inches" pattern
-            peak_match = re.search(r"peak[:\s]*(\d+)\s*(?:Inches?|\")", text, re.IGNORECASE)
-            if peak_match and snow.base_depth_in is None:
-                snow.base_depth_in = float(peak_match.group(1))
+            if snow.base_depth_in is None:
+                peak_match = _search_near(text_lower, "peak", _PEAK_RE)
+                if peak_match:
+                    snow.base_depth_in = int(peak_match.group(1))
 
             # Season total
-            season_match = re.search(r"season[:\s]*(\d+)\s*(?:Inches?|\")", text, re.IGNORECASE)
+            season_match = _search_near(text_lower, "season", _SEASON_RE)
             if season_match:
-                snow.season_total_in = float(season_match.group(1))
+                snow.season_total_in = int(season_match.group(1))
 
             # Storm total as 48h proxy
-            storm_patterns = [
-                r"storm\s*(?:total)?[:\s]*(\d+)\s*(?:Inches?|\")",
-                r"(\d+)\s*(?:Inches?|\")\s*storm\s*(?:total)?",
-            ]
-            for pattern in storm_patterns:
-                storm_match = re.search(pattern, text, re.IGNORECASE)
+            for rx in _STORM_PATTERNS:
+                storm_match = _search_near(text_lower, "storm", rx)
                 if storm_match:
-                    snow.new_snow_48h_in = float(storm_match.group(1))
+                    snow.new_snow_48h_in = int(storm_match.group(1))
                     break
 
             # Open status
             if ops.lifts_open is not None:
                 ops.open_flag = ops.lifts_open > 0
-            elif "mountain closed" in text.lower() or "closed for season" in text.lower():
+            elif "mountain closed" in text_lower or "closed for season" in text_lower:
                 ops.open_flag = False
-            elif "open" in text.lower():
+            elif "open" in text_lower:
                 ops.open_flag = True
 
             result.ops = ops
@@ -137,13 +169,30 @@ class DiamondPeakAdapter(BaseAdapter):
 
         return result
 
-    def _extract_snow_value(self, text: str, *patterns: str) -> Optional[float]:
-        """Try multiple patterns to extract a snow value."""
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+    @staticmethod
+    def _count_trail_rows(rows: list) -> int:
+        """Count trail rows, skipping terrain park (Village) items."""
+        count = 0
+        for row in rows:
+            label = row.find(class_="conditions__label")
+            if label and "Village" in label.get_text():
+                continue
+            count += 1
+        return count
+
+    def _extract_snow_value(
+        self, text: str, keyword: str, *patterns: re.Pattern
+    ) -> Optional[int]:
+        """Try multiple precompiled patterns near a keyword.
+
+        The patterns capture whole digits only, so int() parses the capture
+        directly; the float fields accept it as-is.
+        """
+        for rx in patterns:
+            match = _search_near(text, keyword, rx)
             if match:
                 try:
-                    return float(match.group(1))
+                    return int(match.group(1))
                 except (ValueError, IndexError):
                     continue
         return None
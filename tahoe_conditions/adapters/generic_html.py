@@ -1,16 +1,54 @@
 """Generic HTML adapter that looks for common patterns."""
 
 import logging
-import re
 from typing import Optional
 
-from bs4 import BeautifulSoup
+import lxml.html
 
+from tahoe_conditions.adapters._parsing import compile_scan, parse_html
 from tahoe_conditions.adapters.base import BaseAdapter, ParseResult
 from tahoe_conditions.models import Operations, Snow
 
 logger = logging.getLogger(__name__)
 
+# Every field pattern fused into one alternation so a single finditer pass
+# covers the page text instead of ~15 independent full-text searches. Each
+# branch ends with a uniquely named group; _scan dispatches on
+# match.lastgroup with first-hit-wins per field.
+_COMBINED_RE = compile_scan(
+    # Lifts
+    r"(?P<l1o>\d+)\s*/\s*(?P<l1t>\d+)\s*lifts?"
+    r"|lifts?\s+open[:\s]*(?P<l2o>\d+)\s*/\s*(?P<l2t>\d+)"
+    r"|lifts?\s*[:\s]*(?P<l3o>\d+)\s*/\s*(?P<l3t>\d+)"
+    r"|(?P<l4o>\d+)\s+of\s+(?P<l4t>\d+)\s+lifts?"
+    # Trails
+    r"|(?P<t1o>\d+)\s*/\s*(?P<t1t>\d+)\s*(?:trails?|runs?)"
+    r"|(?:trails?|runs?)\s*[:\s]*(?P<t2o>\d+)\s*/\s*(?P<t2t>\d+)"
+    r"|(?P<t3o>\d+)\s+of\s+(?P<t3t>\d+)\s+(?:trails?|runs?)"
+    # New snow, 24h
+    r"|(?P<s24a>\d+(?:\.\d+)?)[\"″]\s*(?:in\s+)?(?:last\s+)?24\s*(?:hr|hour)"
+    r"|24\s*(?:hr|hour)[s]?\s*[:\s]*(?P<s24b>\d+(?:\.\d+)?)[\"″]?"
+    r"|new\s+snow\s*\(?24[h]?\)?\s*[:\s]*(?P<s24c>\d+(?:\.\d+)?)"
+    r"|(?P<s24d>\d+(?:\.\d+)?)\s*(?:in|inches?|\")\s*(?:in\s+)?24\s*(?:hr|hour)"
+    # New snow, 48h
+    r"|(?P<s48a>\d+(?:\.\d+)?)[\"″]\s*(?:in\s+)?(?:last\s+)?48\s*(?:hr|hour)"
+    r"|48\s*(?:hr|hour)[s]?\s*[:\s]*(?P<s48b>\d+(?:\.\d+)?)[\"″]?"
+    r"|new\s+snow\s*\(?48[h]?\)?\s*[:\s]*(?P<s48c>\d+(?:\.\d+)?)"
+    r"|(?P<s48d>\d+(?:\.\d+)?)\s*(?:in|inches?|\")\s*(?:in\s+)?48\s*(?:hr|hour)"
+    # Base depth (range first, then single value)
+    r"|base\s*(?:depth)?[:\s]*(?P<b1lo>\d+(?:\.\d+)?)\s*[-–]\s*(?P<b1hi>\d+(?:\.\d+)?)"
+    r"|base\s*(?:depth)?[:\s]*(?P<b2>\d+(?:\.\d+)?)[\"″]?\s*(?:in|inches?)?"
+    r"|(?P<b3>\d+(?:\.\d+)?)[\"″]?\s*base"
+    # Season total
+    r"|season\s*total[:\s]*(?P<n1>\d+(?:\.\d+)?)[\"″]?\s*(?:in|inches?)?"
+    r"|ytd[:\s]*(?P<n2>\d+(?:\.\d+)?)[\"″]?"
+    r"|(?P<n3>\d+(?:\.\d+)?)[\"″]?\s*(?:in|inches?)?\s*season"
+    # Surface conditions: greedy class excluding the sentence boundary
+    # instead of lazy-quantifier + alternation (a backtracking hazard);
+    # the {1,50} bound replaces the old Python-side length check
+    r"|(?:surface|conditions?)[:\s]+(?P<surf>[^.\n]{1,50})"
+)
+
 
 class GenericHTMLAdapter(BaseAdapter):
     """
@@ -20,42 +58,37 @@ class GenericHTMLAdapter(BaseAdapter):
     on JS-heavy sites.
     """
 
-    def parse(self, html: str) -> ParseResult:
+    def parse(
+        self,
+        html: str,
+        tree: Optional["lxml.html.HtmlElement"] = None,
+    ) -> ParseResult:
         """Parse HTML looking for common condition patterns."""
         result = ParseResult()
         ops = Operations()
         snow = Snow()
 
         try:
-            soup = BeautifulSoup(html, "lxml")
-
-            # Remove script/style elements
-            for tag in soup(["script", "style", "noscript"]):
-                tag.decompose()
-
-            text = soup.get_text(separator=" ")
+            # Raw lxml: this adapter only needs the page text. (lxml.html.clean
+            # moved to a separate package in lxml 5.2, so script/style removal
+            # uses drop_tree directly — still one C-level subtree drop per tag
+            # instead of BeautifulSoup's Python-level decompose walk.)
+            root = tree if tree is not None else parse_html(html)
+            for el in list(root.iter("script", "style", "noscript")):
+                el.drop_tree()
+
+            # Lowercase once so the combined pattern can skip re.IGNORECASE;
+            # lower() preserves offsets, so surface text is sliced from the
+            # original to keep its casing
+            text = " ".join(" ".join(root.itertext()).split())
             text_lower = text.lower()
 
-            # Look for lift counts
-            lifts = self._find_lift_counts(text, soup)
-            if lifts:
-                ops.lifts_open, ops.lifts_total = lifts
-
-            # Look for trail counts
-            trails = self._find_trail_counts(text, soup)
-            if trails:
-                ops.trails_open, ops.trails_total = trails
+            # Single-pass scan for lifts, trails, and snow data
+            self._scan(text, text_lower, ops, snow)
 
             # Look for open/closed status
             ops.open_flag = self._find_open_status(text_lower, ops)
 
-            # Look for snow data
-            snow.new_snow_24h_in = self._find_new_snow(text, "24")
-            snow.new_snow_48h_in = self._find_new_snow(text, "48")
-            snow.base_depth_in = self._find_base_depth(text)
-            snow.season_total_in = self._find_season_total(text)
-            snow.surface = self._find_surface(text)
-
             result.ops = ops
             result.snow = snow
 
@@ -71,36 +104,44 @@ class GenericHTMLAdapter(BaseAdapter):
 
         return result
 
-    def _find_lift_counts(self, text: str, soup: BeautifulSoup) -> Optional[tuple[int, int]]:
-        """Find lift open/total counts."""
-        patterns = [
-            r"(\d+)\s*/\s*(\d+)\s*lifts?",
-            r"lifts?\s*[:\s]*(\d+)\s*/\s*(\d+)",
-            r"(\d+)\s+of\s+(\d+)\s+lifts?",
-            r"lifts?\s+open[:\s]*(\d+)\s*/\s*(\d+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return int(match.group(1)), int(match.group(2))
-
-        return None
-
-    def _find_trail_counts(self, text: str, soup: BeautifulSoup) -> Optional[tuple[int, int]]:
-        """Find trail open/total counts."""
-        patterns = [
-            r"(\d+)\s*/\s*(\d+)\s*(?:trails?|runs?)",
-            r"(?:trails?|runs?)\s*[:\s]*(\d+)\s*/\s*(\d+)",
-            r"(\d+)\s+of\s+(\d+)\s+(?:trails?|runs?)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return int(match.group(1)), int(match.group(2))
-
-        return None
+    def _scan(self, text: str, text_lower: str, ops: Operations, snow: Snow) -> None:
+        """Walk the text once, filling ops/snow from the combined pattern."""
+        for m in _COMBINED_RE.finditer(text_lower):
+            group = m.lastgroup
+            if group in ("l1t", "l2t", "l3t", "l4t"):
+                if ops.lifts_open is None:
+                    ops.lifts_open = int(m.group(group[:2] + "o"))
+                    ops.lifts_total = int(m.group(group))
+            elif group in ("t1t", "t2t", "t3t"):
+                if ops.trails_open is None:
+                    ops.trails_open = int(m.group(group[:2] + "o"))
+                    ops.trails_total = int(m.group(group))
+            elif group in ("s24a", "s24b", "s24c", "s24d"):
+                if snow.new_snow_24h_in is None:
+                    snow.new_snow_24h_in = float(m.group(group))
+            elif group in ("s48a", "s48b", "s48c", "s48d"):
+                if snow.new_snow_48h_in is None:
+                    snow.new_snow_48h_in = float(m.group(group))
+            elif group == "b1hi":
+                if snow.base_depth_in is None:
+                    # Range - take the average
+                    snow.base_depth_in = (
+                        float(m.group("b1lo")) + float(m.group("b1hi"))
+                    ) / 2
+            elif group in ("b2", "b3"):
+                if snow.base_depth_in is None:
+                    snow.base_depth_in = float(m.group(group))
+            elif group in ("n1", "n2", "n3"):
+                if snow.season_total_in is None:
+                    snow.season_total_in = float(m.group(group))
+            elif group == "surf":
+                if snow.surface is None:
+                    # Slice the original-cased text at the match offsets.
+                    # Indexed by number: RE2's Match.span only takes
+                    # integer group indices, and lastindex is the surf
+                    # group here since it's the branch that matched.
+                    start, end = m.span(m.lastindex)
+                    snow.surface = self.clean_text(text[start:end])
 
     def _find_open_status(self, text_lower: str, ops: Operations) -> Optional[bool]:
         """Determine if resort is open."""
@@ -115,68 +156,3 @@ class GenericHTMLAdapter(BaseAdapter):
             return ops.lifts_open > 0
 
         return None
-
-    def _find_new_snow(self, text: str, hours: str) -> Optional[float]:
-        """Find new snow for given hour period."""
-        patterns = [
-            rf"(\d+(?:\.\d+)?)[\"″]\s*(?:in\s+)?(?:last\s+)?{hours}\s*(?:hr|hour)",
-            rf"{hours}\s*(?:hr|hour)[s]?\s*[:\s]*(\d+(?:\.\d+)?)[\"″]?",
-            rf"new\s+snow\s*\(?{hours}[h]?\)?\s*[:\s]*(\d+(?:\.\d+)?)",
-            rf"(\d+(?:\.\d+)?)\s*(?:in|inches?|\")\s*(?:in\s+)?{hours}\s*(?:hr|hour)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return float(match.group(1))
-
-        return None
-
-    def _find_base_depth(self, text: str) -> Optional[float]:
-        """Find base depth."""
-        patterns = [
-            r"base\s*(?:depth)?[:\s]*(\d+(?:\.\d+)?)\s*[-–]\s*(\d+(?:\.\d+)?)",
-            r"base\s*(?:depth)?[:\s]*(\d+(?:\.\d+)?)[\"″]?\s*(?:in|inches?)?",
-            r"(\d+(?:\.\d+)?)[\"″]?\s*base",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                if match.lastindex == 2:
-                    # Range - return average
-                    return (float(match.group(1)) + float(match.group(2))) / 2
-                return float(match.group(1))
-
-        return None
-
-    def _find_season_total(self, text: str) -> Optional[float]:
-        """Find season total snowfall."""
-        patterns = [
-            r"season\s*total[:\s]*(\d+(?:\.\d+)?)[\"″]?\s*(?:in|inches?)?",
-            r"ytd[:\s]*(\d+(?:\.\d+)?)[\"″]?",
-            r"(\d+(?:\.\d+)?)[\"″]?\s*(?:in|inches?)?\s*season",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return float(match.group(1))
-
-        return None
-
-    def _find_surface(self, text: str) -> Optional[str]:
-        """Find surface conditions description."""
-        patterns = [
-            r"surface[:\s]+([A-Za-z\s,]+?)(?:\.|$|\n)",
-            r"conditions?[:\s]+([A-Za-z\s,]+?)(?:\.|$|\n)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                surface = self.clean_text(match.group(1))
-                if len(surface) < 50:  # Reasonable length
-                    return surface
-
-        return None
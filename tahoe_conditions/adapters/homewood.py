@@ -1,15 +1,27 @@
 """Adapter for Homewood Mountain Resort."""
 
 import logging
-import re
+from typing import Optional
 
-from bs4 import BeautifulSoup
+import lxml.html
 
+from tahoe_conditions.adapters._parsing import compile_scan, parse_html
 from tahoe_conditions.adapters.base import BaseAdapter, ParseResult
 from tahoe_conditions.models import Operations, Snow
 
 logger = logging.getLogger(__name__)
 
+# All fields fused into one alternation so a single finditer pass covers the
+# page text. Each branch ends with a uniquely named group; dispatch on
+# match.lastgroup.
+_COMBINED_RE = compile_scan(
+    r"open\s+lifts[^0-9]*(?P<lo>\d+)\s*/\s*(?P<lt>\d+)"
+    r"|open\s+runs[^0-9]*(?P<to>\d+)\s*/\s*(?P<tt>\d+)"
+    r"|(?:base|summit)[:\s]*(?P<base>\d+(?:\.\d+)?)\s*(?:in|\")"
+    r"|season\s*(?:total)?[:\s]*(?P<season>\d+(?:\.\d+)?)\s*(?:in|\")"
+    r"|(?:24\s*(?:hr|hour)|overnight)[:\s]*(?P<s24>\d+(?:\.\d+)?)\s*(?:in|\")"
+)
+
 
 class HomewoodAdapter(BaseAdapter):
     """
@@ -21,60 +33,38 @@ class HomewoodAdapter(BaseAdapter):
     - Snow depths with base/summit values
     """
 
-    def parse(self, html: str) -> ParseResult:
+    def parse(
+        self,
+        html: str,
+        tree: Optional["lxml.html.HtmlElement"] = None,
+    ) -> ParseResult:
         result = ParseResult()
         ops = Operations()
         snow = Snow()
 
         try:
-            soup = BeautifulSoup(html, "lxml")
-            text = soup.get_text(separator=" ")
-            text = re.sub(r"\s+", " ", text)
-
-            # === LIFTS ===
-            # Pattern: "Open Lifts" ... "X/Y"
-            lift_match = re.search(
-                r"Open\s+Lifts[^0-9]*(\d+)\s*/\s*(\d+)",
-                text, re.IGNORECASE
-            )
-            if lift_match:
-                ops.lifts_open = int(lift_match.group(1))
-                ops.lifts_total = int(lift_match.group(2))
-
-            # === TRAILS ===
-            # Pattern: "Open Runs" ... "X/Y"
-            trails_match = re.search(
-                r"Open\s+Runs[^0-9]*(\d+)\s*/\s*(\d+)",
-                text, re.IGNORECASE
-            )
-            if trails_match:
-                ops.trails_open = int(trails_match.group(1))
-                ops.trails_total = int(trails_match.group(2))
-
-            # === SNOW DATA ===
-            # Base depth - look for "Base: X.X in" or similar
-            base_match = re.search(
-                r"(?:Base|Summit)[:\s]*(\d+(?:\.\d+)?)\s*(?:in|\")",
-                text, re.IGNORECASE
-            )
-            if base_match:
-                snow.base_depth_in = float(base_match.group(1))
-
-            # Season total
-            season_match = re.search(
-                r"Season\s*(?:Total)?[:\s]*(\d+(?:\.\d+)?)\s*(?:in|\")",
-                text, re.IGNORECASE
-            )
-            if season_match:
-                snow.season_total_in = float(season_match.group(1))
-
-            # 24h/12h snow
-            new_snow_match = re.search(
-                r"(?:24\s*(?:hr|hour)|overnight)[:\s]*(\d+(?:\.\d+)?)\s*(?:in|\")",
-                text, re.IGNORECASE
-            )
-            if new_snow_match:
-                snow.new_snow_24h_in = float(new_snow_match.group(1))
+            # Text-only adapter: raw lxml avoids BeautifulSoup's per-node
+            # Python wrappers
+            root = tree if tree is not None else parse_html(html)
+            # Lowercase once so the patterns can skip re.IGNORECASE
+            text = " ".join(" ".join(root.itertext()).split()).lower()
+
+            # === LIFTS / TRAILS / SNOW DATA ===
+            # Single pass over the text; first hit per field wins
+            for m in _COMBINED_RE.finditer(text):
+                group = m.lastgroup
+                if group == "lt" and ops.lifts_open is None:
+                    ops.lifts_open = int(m.group("lo"))
+                    ops.lifts_total = int(m.group("lt"))
+                elif group == "tt" and ops.trails_open is None:
+                    ops.trails_open = int(m.group("to"))
+                    ops.trails_total = int(m.group("tt"))
+                elif group == "base" and snow.base_depth_in is None:
+                    snow.base_depth_in = float(m.group("base"))
+                elif group == "season" and snow.season_total_in is None:
+                    snow.season_total_in = float(m.group("season"))
+                elif group == "s24" and snow.new_snow_24h_in is None:
+                    snow.new_snow_24h_in = float(m.group("s24"))
 
             # === OPEN STATUS ===
             if ops.lifts_open is not None:
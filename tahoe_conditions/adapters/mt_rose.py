@@ -4,13 +4,42 @@ import logging
 import re
 from typing import Optional
 
-from bs4 import BeautifulSoup
+import lxml.html
 
+from tahoe_conditions.adapters._parsing import compile_scan, parse_html
 from tahoe_conditions.adapters.base import BaseAdapter, ParseResult
 from tahoe_conditions.models import Operations, Snow
 
 logger = logging.getLogger(__name__)
 
+# Known lifts at Mt Rose
+_LIFT_NAMES = (
+    "Northwest Express",
+    "Zephyr Express",
+    "Lakeview Express",
+    "Wizard",
+    "Magic",
+    "Galena",
+    "Chuter",
+    "Blazing Zephyr",
+)
+
+# All lift names in one alternation so a single finditer pass covers the
+# text. The status is a bounded keyword alternation rather than the old
+# open-ended (\w+(?:\s+\w+)*), which could backtrack badly on long pages.
+_LIFT_STATUS_RE = compile_scan(
+    "(" + "|".join(re.escape(name.lower()) for name in _LIFT_NAMES) + ")"
+    r"\s+(open|closed|scheduled\S*|on\s+hold|delayed)"
+)
+
+_TRAIL_COUNT_RE = re.compile(r"(\d+)\s*/\s*(\d+)\s*(?:trails?|runs?)")
+
+# Snow values may be ranges like "47-58""
+_NEW_SNOW_RE = re.compile(r"new\s*snow[:\s]*(\d+)[-–]?(\d+)?[\"″]")
+_BASE_RE = re.compile(r"base\s*(?:depth)?[:\s]*(\d+)[-–]?(\d+)?[\"″]")
+_SEASON_RE = re.compile(r"season\s*(?:total)?[:\s]*(\d+)[-–]?(\d+)?[\"″]")
+_STORM_RE = re.compile(r"storm\s*(?:total)?[:\s]*(\d+)[-–]?(\d+)?[\"″]")
+
 
 class MtRoseAdapter(BaseAdapter):
     """
@@ -23,60 +52,58 @@ class MtRoseAdapter(BaseAdapter):
     """
 
     # Known lifts at Mt Rose
-    LIFT_NAMES = [
-        "Northwest Express",
-        "Zephyr Express",
-        "Lakeview Express",
-        "Wizard",
-        "Magic",
-        "Galena",
-        "Chuter",
-        "Blazing Zephyr",
-    ]
-
-    def parse(self, html: str) -> ParseResult:
+    LIFT_NAMES = _LIFT_NAMES
+
+    def parse(
+        self,
+        html: str,
+        tree: Optional["lxml.html.HtmlElement"] = None,
+    ) -> ParseResult:
         result = ParseResult()
         ops = Operations()
         snow = Snow()
 
         try:
-            soup = BeautifulSoup(html, "lxml")
+            # Only the lift-status class lookup needs structure; raw lxml
+            # covers that via find_class without BeautifulSoup wrappers.
+            # Reuse a caller-provided tree when available.
+            root = tree if tree is not None else parse_html(html)
+
+            # Full page text extracted once; repeated text extraction is the
+            # dominant per-page cost here. Lowercase once so the patterns
+            # can skip re.IGNORECASE.
+            text = " ".join(" ".join(root.itertext()).split()).lower()
 
             # === LIFTS ===
             # Find the lift-status section
-            lift_section = soup.find(class_="lift-status")
-            if lift_section:
-                lift_text = lift_section.get_text(separator=" ")
-                lift_text = re.sub(r"\s+", " ", lift_text)
+            lift_sections = root.find_class("lift-status")
+            if lift_sections:
+                lift_text = " ".join(" ".join(lift_sections[0].itertext()).split()).lower()
                 ops.lifts_open, ops.lifts_total = self._count_lifts(lift_text)
             else:
                 # Fallback to full page search
-                text = soup.get_text(separator=" ")
-                text = re.sub(r"\s+", " ", text)
                 ops.lifts_open, ops.lifts_total = self._count_lifts(text)
 
             # === TRAILS ===
             # Count trails from the trail status sections
-            ops.trails_open, ops.trails_total = self._count_trails(soup)
+            ops.trails_open, ops.trails_total = self._count_trails(text)
 
             # === SNOW DATA ===
-            text = soup.get_text(separator=" ")
-            text = re.sub(r"\s+", " ", text)
 
             # New Snow - ranges like "47-58""
-            snow.new_snow_24h_in = self._parse_range(text, r"new\s*snow[:\s]*(\d+)[-–]?(\d+)?[\"″]")
-            snow.base_depth_in = self._parse_range(text, r"base\s*(?:depth)?[:\s]*(\d+)[-–]?(\d+)?[\"″]")
-            snow.season_total_in = self._parse_range(text, r"season\s*(?:total)?[:\s]*(\d+)[-–]?(\d+)?[\"″]")
+            snow.new_snow_24h_in = self._parse_range(text, _NEW_SNOW_RE)
+            snow.base_depth_in = self._parse_range(text, _BASE_RE)
+            snow.season_total_in = self._parse_range(text, _SEASON_RE)
 
             # Storm total as 48h proxy
-            storm = self._parse_range(text, r"storm\s*(?:total)?[:\s]*(\d+)[-–]?(\d+)?[\"″]")
+            storm = self._parse_range(text, _STORM_RE)
             if storm:
                 snow.new_snow_48h_in = storm
 
             # === OPEN STATUS ===
             if ops.lifts_open is not None and ops.lifts_open > 0:
                 ops.open_flag = True
-            elif "closed" in text.lower() and "chutes" not in text.lower()[:text.lower().find("closed")+20]:
+            elif "closed" in text and "chutes" not in text[:text.find("closed") + 20]:
                 # Check if "closed" refers to the mountain, not just chutes
                 ops.open_flag = False
             else:
@@ -94,52 +121,43 @@ class MtRoseAdapter(BaseAdapter):
 
     def _count_lifts(self, text: str) -> tuple[Optional[int], Optional[int]]:
         """Count open and total lifts from text."""
-        lifts_open = 0
-        lifts_total = 0
-
-        for lift_name in self.LIFT_NAMES:
-            # Look for the lift name followed by status
-            pattern = rf"{re.escape(lift_name)}\s+(\w+(?:\s+\w+)*)"
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                lifts_total += 1
-                status = match.group(1).lower()
-                # "Scheduled to open" = will be open = count as open
-                if "scheduled" in status or "open" in status:
-                    lifts_open += 1
-                # "Closed" = not open
-
-        if lifts_total == 0:
+        # One pass over the text; first status hit per lift wins
+        seen: dict[str, bool] = {}
+        for match in _LIFT_STATUS_RE.finditer(text):
+            name = match.group(1)
+            if name in seen:
+                continue
+            status = match.group(2)
+            # "Scheduled to open" = will be open = count as open
+            # "Closed" = not open
+            seen[name] = "scheduled" in status or "open" in status
+
+        if not seen:
             return None, None
-        return lifts_open, lifts_total
+        return sum(seen.values()), len(seen)
 
-    def _count_trails(self, soup: BeautifulSoup) -> tuple[Optional[int], Optional[int]]:
+    def _count_trails(self, text: str) -> tuple[Optional[int], Optional[int]]:
         """Count open and total trails.
 
         Mt Rose doesn't publish explicit trail counts - they show terrain
         percentage open instead (e.g., "90% of All Terrain Available").
         Return None since we can't get accurate counts.
         """
-        # Look for "X / Y trails" or similar pattern first
-        text = soup.get_text(separator=" ")
-        text = re.sub(r"\s+", " ", text)
-
         # Try to find explicit trail counts
-        match = re.search(r"(\d+)\s*/\s*(\d+)\s*(?:trails?|runs?)", text, re.IGNORECASE)
+        match = _TRAIL_COUNT_RE.search(text)
         if match:
             return int(match.group(1)), int(match.group(2))
 
         # Mt Rose doesn't publish explicit counts
         return None, None
 
-    def _parse_range(self, text: str, pattern: str) -> Optional[float]:
+    def _parse_range(self, text: str, rx: re.Pattern) -> Optional[float]:
         """Parse a value that might be a range like '47-58'."""
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = rx.search(text)
         if match:
-            low = float(match.group(1))
-            high_str = match.group(2) if match.lastindex >= 2 else None
+            low_str, high_str = match.groups()
+            low = float(low_str)
             if high_str:
-                high = float(high_str)
-                return (low + high) / 2
+                return (low + float(high_str)) / 2
             return low
         return None
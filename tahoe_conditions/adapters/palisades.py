@@ -3,14 +3,60 @@
 import json
 import logging
 import re
+from typing import TYPE_CHECKING, Optional
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
+from tahoe_conditions.adapters._parsing import _search_near, compile_scan
 from tahoe_conditions.adapters.base import BaseAdapter, ParseResult
 from tahoe_conditions.models import Operations, Snow
 
+# Optional: orjson decodes the embedded mtnfeed state blob (often
+# hundreds of KB) several times faster than stdlib json. Installed via
+# the "speed" extra.
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+if TYPE_CHECKING:
+    import lxml.html
+
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r"\s+")
+
+# mtnfeed widget patterns, matched against the raw HTML
+_LIFT_WIDGET_RE = re.compile(
+    r"Lifts</h3>.*?<strong>(\d+)/(\d+)</strong>.*?Open", re.IGNORECASE | re.DOTALL
+)
+_TRAIL_WIDGET_RE = re.compile(
+    r"Trails</h3>.*?<strong>(\d+)/(\d+)</strong>.*?Open", re.IGNORECASE | re.DOTALL
+)
+
+# Text-based fallbacks, fused into one alternation so a single finditer
+# pass fills both lift and trail counts; dispatch on match.lastgroup
+_TEXT_FALLBACK_RE = compile_scan(
+    # Inline (?i) keeps the pattern portable across regex backends
+    "(?i)"
+    r"(?P<lo1>\d+)\s*(?:of|/)\s*(?P<lt1>\d+)\s*lifts?\s*(?:open|running)"
+    r"|lifts?\s*(?:open|running)[:\s]*(?P<lo2>\d+)\s*(?:of|/)\s*(?P<lt2>\d+)"
+    r"|(?P<to1>\d+)\s*(?:of|/)\s*(?P<tt1>\d+)\s*(?:trails?|runs?)\s*(?:open|groomed)"
+    r"|(?:trails?|runs?)\s*(?:open|groomed)[:\s]*(?P<to2>\d+)\s*(?:of|/)\s*(?P<tt2>\d+)"
+)
+
+# mtnfeed format: '0" - --" New Snow' (24hr - 48hr)
+_NEW_SNOW_RE = re.compile(r'(\d+)"\s*-\s*(?:(\d+)|--)".*?New\s*Snow', re.IGNORECASE)
+_BASE_RE = re.compile(r'Base.*?(\d{2,3})"', re.IGNORECASE)
+_SEASON_RE = re.compile(r'(?:Season\s*Total|YTD|Season).*?(\d{2,3})"', re.IGNORECASE)
+
+_INITIAL_STATE_RE = re.compile(r"__INITIAL_STATE__\s*=\s*({.+?});", re.DOTALL)
+
+# Only script tags matter when hunting __INITIAL_STATE__; the strainer
+# lets lxml skip every other subtree
+_SCRIPT_STRAINER = SoupStrainer("script")
+
 
 class PalisadesAdapter(BaseAdapter):
     """
@@ -22,73 +68,63 @@ class PalisadesAdapter(BaseAdapter):
     - Snow data in various formats
     """
 
-    def parse(self, html: str) -> ParseResult:
+    def parse(
+        self,
+        html: str,
+        tree: Optional["lxml.html.HtmlElement"] = None,
+    ) -> ParseResult:
         result = ParseResult()
         ops = Operations()
         snow = Snow()
 
         try:
-            soup = BeautifulSoup(html, "lxml")
+            # Building the DOM for a large React page is the most expensive
+            # step here, and the widget patterns usually succeed on the raw
+            # HTML — so the page text is only extracted if a fallback
+            # actually needs it
+            text = None
 
             # === LIFTS ===
             # mtnfeed widget pattern: Lifts</h3>...<strong>26/39</strong>...<span> Open</span>
-            lift_match = re.search(
-                r"Lifts</h3>.*?<strong>(\d+)/(\d+)</strong>.*?Open",
-                html, re.IGNORECASE | re.DOTALL
-            )
+            lift_match = _LIFT_WIDGET_RE.search(html)
             if lift_match:
                 ops.lifts_open = int(lift_match.group(1))
                 ops.lifts_total = int(lift_match.group(2))
 
             # === TRAILS ===
             # mtnfeed widget pattern: Trails</h3>...<strong>97/296</strong>...<span> Open</span>
-            trail_match = re.search(
-                r"Trails</h3>.*?<strong>(\d+)/(\d+)</strong>.*?Open",
-                html, re.IGNORECASE | re.DOTALL
-            )
+            trail_match = _TRAIL_WIDGET_RE.search(html)
             if trail_match:
                 ops.trails_open = int(trail_match.group(1))
                 ops.trails_total = int(trail_match.group(2))
 
-            # Fallback to text-based patterns if HTML parsing didn't work
-            if ops.lifts_open is None:
-                text = soup.get_text(separator=" ")
-                text = re.sub(r"\s+", " ", text)
-
-                lift_patterns = [
-                    r"(\d+)\s*(?:of|/)\s*(\d+)\s*lifts?\s*(?:open|running)",
-                    r"lifts?\s*(?:open|running)[:\s]*(\d+)\s*(?:of|/)\s*(\d+)",
-                ]
-                for pattern in lift_patterns:
-                    match = re.search(pattern, text, re.IGNORECASE)
-                    if match:
-                        ops.lifts_open = int(match.group(1))
-                        ops.lifts_total = int(match.group(2))
-                        break
-
-            if ops.trails_open is None:
-                text = soup.get_text(separator=" ") if 'text' not in dir() else text
-                text = re.sub(r"\s+", " ", text)
-
-                trail_patterns = [
-                    r"(\d+)\s*(?:of|/)\s*(\d+)\s*(?:trails?|runs?)\s*(?:open|groomed)",
-                    r"(?:trails?|runs?)\s*(?:open|groomed)[:\s]*(\d+)\s*(?:of|/)\s*(\d+)",
-                ]
-                for pattern in trail_patterns:
-                    match = re.search(pattern, text, re.IGNORECASE)
-                    if match:
-                        ops.trails_open = int(match.group(1))
-                        ops.trails_total = int(match.group(2))
-                        break
+            # Fallback to text-based patterns if HTML parsing didn't work;
+            # one pass fills whichever of the two counts is still missing
+            if ops.lifts_open is None or ops.trails_open is None:
+                text = _WS_RE.sub(" ", BeautifulSoup(html, "lxml").get_text(separator=" "))
+
+                for m in _TEXT_FALLBACK_RE.finditer(text):
+                    group = m.lastgroup
+                    if group in ("lt1", "lt2"):
+                        if ops.lifts_open is None:
+                            ops.lifts_open = int(m.group("lo" + group[2]))
+                            ops.lifts_total = int(m.group(group))
+                    elif group in ("tt1", "tt2"):
+                        if ops.trails_open is None:
+                            ops.trails_open = int(m.group("to" + group[2]))
+                            ops.trails_total = int(m.group(group))
 
             # === SNOW DATA ===
-            text = soup.get_text(separator=" ")
-            text = re.sub(r"\s+", " ", text)
+            if text is None:
+                text = _WS_RE.sub(" ", BeautifulSoup(html, "lxml").get_text(separator=" "))
+
+            # str.find anchors each unbounded .*? pattern to a short
+            # window around its keyword instead of the whole page text
+            text_lower = text.lower()
 
             # mtnfeed format: '0" - --" New Snow' (24hr - 48hr)
-            new_snow_match = re.search(
-                r'(\d+)"\s*-\s*(?:(\d+)|--)".*?New\s*Snow',
-                text, re.IGNORECASE
+            new_snow_match = _search_near(
+                text_lower, "new snow", _NEW_SNOW_RE, before=30, after=20
             )
             if new_snow_match:
                 snow.new_snow_24h_in = float(new_snow_match.group(1))
@@ -96,37 +132,38 @@ class PalisadesAdapter(BaseAdapter):
                     snow.new_snow_48h_in = float(new_snow_match.group(2))
 
             # Base depth - look for pattern like 'Base 102"' in WeatherCard
-            base_match = re.search(
-                r'Base.*?(\d{2,3})"',
-                text, re.IGNORECASE
-            )
+            base_match = _search_near(text_lower, "base", _BASE_RE, before=0, after=40)
             if base_match:
                 snow.base_depth_in = float(base_match.group(1))
 
             # Season total - look for 'Season Total' or 'YTD'
-            season_match = re.search(
-                r'(?:Season\s*Total|YTD|Season).*?(\d{2,3})"',
-                text, re.IGNORECASE
-            )
+            season_match = _search_near(
+                text_lower, "season", _SEASON_RE, before=0, after=50
+            ) or _search_near(text_lower, "ytd", _SEASON_RE, before=0, after=50)
             if season_match:
                 snow.season_total_in = float(season_match.group(1))
 
             # === Try to find JSON data embedded in page ===
-            # mtnfeed often has window.__INITIAL_STATE__ or similar
-            script_tags = soup.find_all("script")
-            for script in script_tags:
-                if script.string and "__INITIAL_STATE__" in script.string:
-                    # Try to extract JSON
-                    json_match = re.search(
-                        r"__INITIAL_STATE__\s*=\s*({.+?});",
-                        script.string, re.DOTALL
-                    )
-                    if json_match:
-                        try:
-                            data = json.loads(json_match.group(1))
-                            self._parse_mtnfeed_json(data, ops, snow)
-                        except json.JSONDecodeError:
-                            pass
+            # mtnfeed often has window.__INITIAL_STATE__ or similar. A raw
+            # substring check gates the whole block, and the script-only
+            # soup parses a fraction of the page.
+            if "__INITIAL_STATE__" in html:
+                script_soup = BeautifulSoup(html, "lxml", parse_only=_SCRIPT_STRAINER)
+                for script in script_soup.find_all("script"):
+                    if script.string and "__INITIAL_STATE__" in script.string:
+                        # Try to extract JSON
+                        json_match = _INITIAL_STATE_RE.search(script.string)
+                        if json_match:
+                            blob = json_match.group(1)
+                            # Both decoders raise ValueError subclasses
+                            try:
+                                if HAS_ORJSON:
+                                    data = orjson.loads(blob)
+                                else:
+                                    data = json.loads(blob)
+                                self._parse_mtnfeed_json(data, ops, snow)
+                            except ValueError:
+                                pass
 
             # === OPEN STATUS ===
             if ops.lifts_open is not None:
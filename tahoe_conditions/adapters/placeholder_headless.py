@@ -1,11 +1,23 @@
 """Placeholder adapter for sites that require headless browser."""
 
 import logging
+from typing import TYPE_CHECKING, Optional
 
 from tahoe_conditions.adapters.base import BaseAdapter, ParseResult
 
+if TYPE_CHECKING:
+    import lxml.html
+
 logger = logging.getLogger(__name__)
 
+# The response never varies, so build it once. Callers treat ParseResult
+# as read-only, making the shared instance safe.
+_PLACEHOLDER_RESULT = ParseResult(
+    success=False,
+    needs_headless=True,
+    error="This resort requires JavaScript rendering (headless browser)",
+)
+
 
 class PlaceholderHeadlessAdapter(BaseAdapter):
     """
@@ -15,11 +27,11 @@ class PlaceholderHeadlessAdapter(BaseAdapter):
     signaling that future implementation with Playwright is needed.
     """
 
-    def parse(self, html: str) -> ParseResult:
+    def parse(
+        self,
+        html: str,
+        tree: Optional["lxml.html.HtmlElement"] = None,
+    ) -> ParseResult:
         """Return placeholder result indicating headless browser needed."""
-        logger.info("Placeholder adapter: this resort requires headless browser")
-        return ParseResult(
-            success=False,
-            needs_headless=True,
-            error="This resort requires JavaScript rendering (headless browser)"
-        )
+        logger.debug("Placeholder adapter: this resort requires headless browser")
+        return _PLACEHOLDER_RESULT
@@ -33,18 +33,28 @@ ADAPTER_REGISTRY: dict[str, Type[BaseAdapter]] = {
     "placeholder_headless": PlaceholderHeadlessAdapter,
 }
 
+# Adapters are stateless parsers, so one shared instance per kind is
+# safe; building them at import avoids a constructor call per fetch
+_ADAPTER_INSTANCES: dict[str, BaseAdapter] = {
+    kind: cls() for kind, cls in ADAPTER_REGISTRY.items()
+}
+
 # Adapters that require JavaScript rendering (Playwright headless browser)
-HEADLESS_ADAPTERS: set[str] = {
+HEADLESS_ADAPTERS: frozenset[str] = frozenset({
     "boreal",
     "palisades",
     "tahoe_donner",
     "placeholder_headless",
-}
+})
+
+# Misconfigured kinds come from resorts.yaml, so warn once per kind
+# rather than on every scheduled fetch
+_warned_kinds: set[str] = set()
 
 
 def get_adapter(kind: str) -> BaseAdapter:
     """
-    Get an adapter instance by kind name.
+    Get the shared adapter instance for a kind name.
 
     Args:
         kind: Adapter type from resorts.yaml
@@ -54,13 +64,15 @@ def get_adapter(kind: str) -> BaseAdapter:
 
     Falls back to generic adapter if kind not found.
     """
-    adapter_class = ADAPTER_REGISTRY.get(kind)
+    adapter = _ADAPTER_INSTANCES.get(kind)
 
-    if adapter_class is None:
-        logger.warning(f"Unknown adapter kind '{kind}', using generic")
-        adapter_class = GenericHTMLAdapter
+    if adapter is None:
+        if kind not in _warned_kinds:
+            _warned_kinds.add(kind)
+            logger.warning(f"Unknown adapter kind '{kind}', using generic")
+        adapter = _ADAPTER_INSTANCES["generic"]
 
-    return adapter_class()
+    return adapter
 
 
 def requires_headless(kind: str) -> bool:
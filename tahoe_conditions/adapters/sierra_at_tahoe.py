@@ -2,14 +2,48 @@
 
 import logging
 import re
+from html import unescape
+from typing import TYPE_CHECKING, Optional
 
-from bs4 import BeautifulSoup
-
+from tahoe_conditions.adapters._parsing import compile_scan
 from tahoe_conditions.adapters.base import BaseAdapter, ParseResult
 from tahoe_conditions.models import Operations, Snow
 
+if TYPE_CHECKING:
+    import lxml.html
+
 logger = logging.getLogger(__name__)
 
+# The patterns below are pure-text, so a tag-stripping regex plus entity
+# decode stands in for a full DOM build, which this adapter never needs
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Every field fused into one alternation so a single finditer pass covers
+# the page text instead of five sequential full-text sweeps. Each branch
+# ends with a uniquely named group; parse dispatches on match.lastgroup
+# with first-hit-wins per field.
+_COMBINED_RE = compile_scan(
+    # Inline (?i) keeps the pattern portable across regex backends.
+    # Lifts: "10/14 Lifts Open" or "Lifts Open: 10/14"
+    "(?i)"
+    r"(?P<lo1>\d+)\s*/\s*(?P<lt1>\d+)\s*lifts?\s*open"
+    r"|lifts?\s*open[:\s]*(?P<lo2>\d+)\s*/\s*(?P<lt2>\d+)"
+    # Runs: "41/50 Runs Open"
+    r"|(?P<to1>\d+)\s*/\s*(?P<tt1>\d+)\s*runs?\s*open"
+    r"|runs?\s*open[:\s]*(?P<to2>\d+)\s*/\s*(?P<tt2>\d+)"
+    # 24-Hour Snowfall
+    r"|24[- ]?hour[:\s]*(?P<s24a>\d+(?:\.\d+)?)"
+    r"|(?P<s24b>\d+(?:\.\d+)?)[\"']\s*(?:in\s+)?24[- ]?hour"
+    r"|last\s*24\s*hours?[:\s]*(?P<s24c>\d+(?:\.\d+)?)"
+    # Base depth - summit value preferred over plain base
+    r"|base\s*depth[:\s]*(?P<ba>\d+(?:\.\d+)?)"
+    r"|(?P<bb>\d+)[\"']\s*\(summit\)"
+    r"|base[:\s]*(?P<bc>\d+)[\"']"
+    # Season/YTD total
+    r"|ytd[:\s]*(?P<ya>\d+)"
+    r"|season\s*total[:\s]*(?P<yb>\d+)"
+)
+
 
 class SierraAtTahoeAdapter(BaseAdapter):
     """
@@ -21,70 +55,38 @@ class SierraAtTahoeAdapter(BaseAdapter):
     - "60" (summit), 35" (base)" for base depth
     """
 
-    def parse(self, html: str) -> ParseResult:
+    def parse(
+        self,
+        html: str,
+        tree: Optional["lxml.html.HtmlElement"] = None,
+    ) -> ParseResult:
         result = ParseResult()
         ops = Operations()
         snow = Snow()
 
         try:
-            soup = BeautifulSoup(html, "lxml")
-            text = soup.get_text(separator=" ")
-
-            # Lifts: "10/14 Lifts Open" or "Lifts Open: 10/14"
-            lift_match = re.search(
-                r"(\d+)\s*/\s*(\d+)\s*lifts?\s*open|lifts?\s*open[:\s]*(\d+)\s*/\s*(\d+)",
-                text, re.IGNORECASE
-            )
-            if lift_match:
-                if lift_match.group(1):
-                    ops.lifts_open = int(lift_match.group(1))
-                    ops.lifts_total = int(lift_match.group(2))
-                else:
-                    ops.lifts_open = int(lift_match.group(3))
-                    ops.lifts_total = int(lift_match.group(4))
-
-            # Runs: "41/50 Runs Open"
-            runs_match = re.search(
-                r"(\d+)\s*/\s*(\d+)\s*runs?\s*open|runs?\s*open[:\s]*(\d+)\s*/\s*(\d+)",
-                text, re.IGNORECASE
-            )
-            if runs_match:
-                if runs_match.group(1):
-                    ops.trails_open = int(runs_match.group(1))
-                    ops.trails_total = int(runs_match.group(2))
-                else:
-                    ops.trails_open = int(runs_match.group(3))
-                    ops.trails_total = int(runs_match.group(4))
-
-            # 24-Hour Snowfall - look for various patterns
-            snow_24_patterns = [
-                r"24[- ]?hour[:\s]*(\d+(?:\.\d+)?)[\"']?\s*(?:in|inches?)?",
-                r"(\d+(?:\.\d+)?)[\"']\s*(?:in\s+)?24[- ]?hour",
-                r"last\s*24\s*hours?[:\s]*(\d+(?:\.\d+)?)",
-            ]
-            for pattern in snow_24_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    snow.new_snow_24h_in = float(match.group(1))
-                    break
-
-            # Base depth - summit/base pattern or just "base depth"
-            base_patterns = [
-                r"base\s*depth[:\s]*(\d+(?:\.\d+)?)",
-                r"(\d+)[\"']\s*\(summit\)",  # Take summit value
-                r"base[:\s]*(\d+)[\"']",
-            ]
-            for pattern in base_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    snow.base_depth_in = float(match.group(1))
-                    break
-
-            # Season/YTD total
-            ytd_match = re.search(r"ytd[:\s]*(\d+)|season\s*total[:\s]*(\d+)", text, re.IGNORECASE)
-            if ytd_match:
-                val = ytd_match.group(1) or ytd_match.group(2)
-                snow.season_total_in = float(val)
+            text = unescape(_TAG_RE.sub(" ", html))
+
+            # Single pass over the text; first hit per field wins
+            for m in _COMBINED_RE.finditer(text):
+                group = m.lastgroup
+                if group in ("lt1", "lt2"):
+                    if ops.lifts_open is None:
+                        ops.lifts_open = int(m.group("lo" + group[2]))
+                        ops.lifts_total = int(m.group(group))
+                elif group in ("tt1", "tt2"):
+                    if ops.trails_open is None:
+                        ops.trails_open = int(m.group("to" + group[2]))
+                        ops.trails_total = int(m.group(group))
+                elif group in ("s24a", "s24b", "s24c"):
+                    if snow.new_snow_24h_in is None:
+                        snow.new_snow_24h_in = float(m.group(group))
+                elif group in ("ba", "bb", "bc"):
+                    if snow.base_depth_in is None:
+                        snow.base_depth_in = float(m.group(group))
+                elif group in ("ya", "yb"):
+                    if snow.season_total_in is None:
+                        snow.season_total_in = float(m.group(group))
 
             # Open status
             ops.open_flag = ops.lifts_open is not None and ops.lifts_open > 0
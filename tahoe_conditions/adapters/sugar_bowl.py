@@ -2,14 +2,53 @@
 
 import logging
 import re
+from typing import TYPE_CHECKING, Optional
 
 from bs4 import BeautifulSoup
 
+from tahoe_conditions.adapters._parsing import compile_scan
 from tahoe_conditions.adapters.base import BaseAdapter, ParseResult
 from tahoe_conditions.models import Operations, Snow
 
+if TYPE_CHECKING:
+    import lxml.html
+
 logger = logging.getLogger(__name__)
 
+_LIFT_FRACTION_RE = re.compile(r"(\d+)\s*/\s*(\d+)\s*Lifts?\s*Open", re.IGNORECASE)
+_TRAIL_FRACTION_RE = re.compile(r"(\d+)\s*/\s*(\d+)\s*Trails?\s*Open", re.IGNORECASE)
+
+_SNOW_24_PATTERNS = (
+    re.compile(r"(\d+(?:\.\d+)?)\s*[\"″]\s*24\s*[Hh]r", re.IGNORECASE),
+    re.compile(r"24\s*[Hh]r\s*(?:Snowfall)?[:\s]*(\d+(?:\.\d+)?)", re.IGNORECASE),
+)
+_YTD_PATTERNS = (
+    re.compile(r"(\d+(?:\.\d+)?)\s*[\"″]\s*(?:Year\s*to\s*Date|YTD)", re.IGNORECASE),
+    re.compile(r"(?:Year\s*to\s*Date|YTD)[:\s]*(\d+(?:\.\d+)?)", re.IGNORECASE),
+)
+_DAY7_RE = re.compile(r"(\d+(?:\.\d+)?)\s*[\"″]\s*7\s*[Dd]ay", re.IGNORECASE)
+_BASE_PATTERNS = (
+    re.compile(r"(?:Summit|Base)[:\s]*(\d+(?:\.\d+)?)\s*[\"″]", re.IGNORECASE),
+    re.compile(r"(\d+(?:\.\d+)?)\s*[\"″]\s*(?:at\s+)?(?:Summit|Base)", re.IGNORECASE),
+)
+
+# Known lift names at Sugar Bowl, fused into one alternation so a single
+# finditer pass covers all of them instead of one scan per name
+_LIFT_NAMES = (
+    "Mt. Judah Express", "Jerome Hill Express", "Mt. Lincoln Express",
+    "Christmas Tree Express", "Mt. Disney Express", "Nob Hill",
+    "White Pine", "Summit Chair", "Gondola", "Flume Carpet", "Crow's Peak",
+)
+_LIFT_STATUS_RE = compile_scan(
+    "(?i)(" + "|".join(re.escape(name) for name in _LIFT_NAMES) + ")"
+    r"[^\n]*\n[^\n]*(Open|Scheduled|Closed)"
+)
+
+# Simpler fallback counter; one scan tallies both status words
+_FALLBACK_STATUS_RE = re.compile(
+    r"(?:lift|chair|express)\s+(open|scheduled)", re.IGNORECASE
+)
+
 
 class SugarBowlAdapter(BaseAdapter):
     """
@@ -22,79 +61,68 @@ class SugarBowlAdapter(BaseAdapter):
     - "X" Year to Date" - season total
     """
 
-    def parse(self, html: str) -> ParseResult:
+    def parse(
+        self,
+        html: str,
+        tree: Optional["lxml.html.HtmlElement"] = None,
+    ) -> ParseResult:
         result = ParseResult()
         ops = Operations()
         snow = Snow()
 
         try:
             soup = BeautifulSoup(html, "lxml")
-            text = soup.get_text(separator=" ")
-            # Normalize whitespace
-            text = re.sub(r"\s+", " ", text)
+            # One DOM walk: the newline-joined text drives the per-lift
+            # status patterns, and the collapsed form everything else
+            raw_text = soup.get_text(separator="\n")
+            text = " ".join(raw_text.split())
+            # Lowercase once; literal probes below reuse this buffer
+            text_lower = text.lower()
 
             # === LIFTS ===
             # Count individual lift statuses for scheduled info
-            lift_counts = self._count_lift_statuses(soup)
+            lift_counts = self._count_lift_statuses(html, raw_text, text_lower)
             if lift_counts["total"] > 0:
                 ops.lifts_open = lift_counts["open"]
                 ops.lifts_scheduled = lift_counts["scheduled"]
                 ops.lifts_total = lift_counts["total"]
             else:
                 # Fallback: Pattern "X / Y Lifts Open"
-                lift_match = re.search(
-                    r"(\d+)\s*/\s*(\d+)\s*Lifts?\s*Open",
-                    text, re.IGNORECASE
-                )
+                lift_match = _LIFT_FRACTION_RE.search(text)
                 if lift_match:
                     ops.lifts_open = int(lift_match.group(1))
                     ops.lifts_total = int(lift_match.group(2))
 
             # === TRAILS ===
             # Pattern: "X / Y Trails Open"
-            trails_match = re.search(
-                r"(\d+)\s*/\s*(\d+)\s*Trails?\s*Open",
-                text, re.IGNORECASE
-            )
+            trails_match = _TRAIL_FRACTION_RE.search(text)
             if trails_match:
                 ops.trails_open = int(trails_match.group(1))
                 ops.trails_total = int(trails_match.group(2))
 
             # === SNOW DATA ===
             # Pattern: X" 24 Hr Snowfall or 24 Hr: X"
-            snow_24_patterns = [
-                r"(\d+(?:\.\d+)?)\s*[\"″]\s*24\s*[Hh]r",
-                r"24\s*[Hh]r\s*(?:Snowfall)?[:\s]*(\d+(?:\.\d+)?)",
-            ]
-            for pattern in snow_24_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+            for rx in _SNOW_24_PATTERNS:
+                match = rx.search(text)
                 if match:
                     snow.new_snow_24h_in = float(match.group(1))
                     break
 
             # Pattern: X" Year to Date or YTD: X"
-            ytd_patterns = [
-                r"(\d+(?:\.\d+)?)\s*[\"″]\s*(?:Year\s*to\s*Date|YTD)",
-                r"(?:Year\s*to\s*Date|YTD)[:\s]*(\d+(?:\.\d+)?)",
-            ]
-            for pattern in ytd_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+            for rx in _YTD_PATTERNS:
+                match = rx.search(text)
                 if match:
                     snow.season_total_in = float(match.group(1))
                     break
 
             # 7-day total as 48h proxy
-            day7_match = re.search(r"(\d+(?:\.\d+)?)\s*[\"″]\s*7\s*[Dd]ay", text, re.IGNORECASE)
+            day7_match = _DAY7_RE.search(text)
             if day7_match:
                 snow.new_snow_48h_in = float(day7_match.group(1))
 
             # Base depth - Summit or Base
-            base_patterns = [
-                r"(?:Summit|Base)[:\s]*(\d+(?:\.\d+)?)\s*[\"″]",
-                r"(\d+(?:\.\d+)?)\s*[\"″]\s*(?:at\s+)?(?:Summit|Base)",
-            ]
-            for pattern in base_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+            for rx in _BASE_PATTERNS:
+                match = rx.search(text)
                 if match:
                     snow.base_depth_in = float(match.group(1))
                     break
@@ -103,7 +131,7 @@ class SugarBowlAdapter(BaseAdapter):
             # Check for "Mountain Status Open" or similar
             # Also consider scheduled lifts as "open for today"
             lifts_active = (ops.lifts_open or 0) + (ops.lifts_scheduled or 0)
-            if "mountain status open" in text.lower():
+            if "mountain status open" in text_lower:
                 ops.open_flag = True
             elif lifts_active > 0:
                 ops.open_flag = True
@@ -122,45 +150,48 @@ class SugarBowlAdapter(BaseAdapter):
 
         return result
 
-    def _count_lift_statuses(self, soup: BeautifulSoup) -> dict:
-        """Count lifts by status from individual lift entries."""
+    def _count_lift_statuses(self, html: str, text: str, text_lower: str) -> dict:
+        """Count lifts by status from individual lift entries.
+
+        html is the raw page (for icon-class substring checks, avoiding a
+        full DOM re-serialization) and text the caller's newline-joined
+        page text, so no extra DOM walk happens here.
+        """
         counts = {"open": 0, "scheduled": 0, "closed": 0, "total": 0}
 
-        # Look for status text patterns in the page
-        text = soup.get_text(separator="\n")
-
-        # Known lift names at Sugar Bowl
-        lift_names = [
-            "Mt. Judah Express", "Jerome Hill Express", "Mt. Lincoln Express",
-            "Christmas Tree Express", "Mt. Disney Express", "Nob Hill",
-            "White Pine", "Summit Chair", "Gondola", "Flume Carpet", "Crow's Peak"
-        ]
-
-        for lift_name in lift_names:
-            # Look for lift name followed by status
-            pattern = rf"{re.escape(lift_name)}[^\n]*\n[^\n]*(Open|Scheduled|Closed)"
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                counts["total"] += 1
-                status = match.group(1).lower()
-                if status == "open":
-                    counts["open"] += 1
-                elif status == "scheduled":
-                    counts["scheduled"] += 1
-                else:
-                    counts["closed"] += 1
+        # Single linear pass; the first status seen for each lift wins,
+        # matching the old one-search-per-name behavior
+        seen: set[str] = set()
+        for match in _LIFT_STATUS_RE.finditer(text):
+            name = match.group(1).lower()
+            if name in seen:
+                continue
+            seen.add(name)
+            counts["total"] += 1
+            status = match.group(2).lower()
+            if status == "open":
+                counts["open"] += 1
+            elif status == "scheduled":
+                counts["scheduled"] += 1
+            else:
+                counts["closed"] += 1
 
         # If no matches found, try a simpler approach - count status occurrences
         if counts["total"] == 0:
             # Count standalone status words that likely refer to lifts
             # This is less accurate but better than nothing
-            open_count = len(re.findall(r"(?:lift|chair|express)\s+open", text, re.IGNORECASE))
-            sched_count = len(re.findall(r"(?:lift|chair|express)\s+scheduled", text, re.IGNORECASE))
+            open_count = 0
+            sched_count = 0
+            for match in _FALLBACK_STATUS_RE.finditer(text):
+                if match.group(1).lower() == "open":
+                    open_count += 1
+                else:
+                    sched_count += 1
 
             # Also check for icon references
-            if "icon_lift_scheduled" in str(soup):
-                sched_count = max(sched_count, text.lower().count("scheduled"))
-            if "icon_lift_open" in str(soup):
+            if "icon_lift_scheduled" in html:
+                sched_count = max(sched_count, text_lower.count("scheduled"))
+            if "icon_lift_open" in html:
                 open_count = max(open_count, 1)
 
         return counts
@@ -2,14 +2,45 @@
 
 import logging
 import re
+from typing import TYPE_CHECKING, Optional
 
-from bs4 import BeautifulSoup
-
+from tahoe_conditions.adapters._parsing import compile_scan, parse_html
 from tahoe_conditions.adapters.base import BaseAdapter, ParseResult
 from tahoe_conditions.models import Operations, Snow
 
+if TYPE_CHECKING:
+    import lxml.html
+
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r"\s+")
+
+# Row classifiers; row text is lowercased before matching, so no
+# IGNORECASE. One C-level scan replaces a Python any()-loop per row.
+_LIFT_KW_RE = re.compile(r"chair|lift|carpet")
+_LIFT_OPEN_RE = re.compile(r"open|yes")
+_TRAIL_KW_RE = re.compile(r"green|blue|black|diamond|run|trail")
+_TRAIL_OPEN_RE = re.compile(r"open|groomed")
+
+# Text-pattern fallbacks and snow fields fused into one alternation; a
+# single finditer pass fills whatever the table scan didn't. Each branch
+# ends with a uniquely named group; dispatch on match.lastgroup.
+_TEXT_SCAN_RE = compile_scan(
+    # Inline (?i) keeps the pattern portable across regex backends
+    "(?i)"
+    # Lifts
+    r"(?P<lo1>\d+)\s*(?:of|/)\s*(?P<lt1>\d+)\s*lifts?\s*(?:open|running)"
+    r"|lifts?\s*(?:open)?[:\s]*(?P<lo2>\d+)\s*(?:of|/)\s*(?P<lt2>\d+)"
+    r"|(?P<lo3>\d+)\s*/\s*(?P<lt3>\d+)\s*lifts?"
+    # Trails
+    r"|(?P<to1>\d+)\s*(?:of|/)\s*(?P<tt1>\d+)\s*(?:trails?|runs?)\s*(?:open|groomed)"
+    r"|(?:trails?|runs?)\s*(?:open)?[:\s]*(?P<to2>\d+)\s*(?:of|/)\s*(?P<tt2>\d+)"
+    # Snow
+    r"|(?:24\s*(?:hr|hour)|new\s*snow|overnight|fresh)[:\s]*(?P<s24>\d+(?:\.\d+)?)\s*(?:in|\")"
+    r"|(?:base|snow\s*depth)[:\s]*(?P<base>\d+(?:\.\d+)?)\s*(?:in|\")"
+    r"|(?:season|ytd)[:\s]*(?P<season>\d+(?:\.\d+)?)\s*(?:in|\")"
+)
+
 
 class TahoeDonnerAdapter(BaseAdapter):
     """
@@ -22,117 +53,80 @@ class TahoeDonnerAdapter(BaseAdapter):
     - Snow conditions in various formats
     """
 
-    def parse(self, html: str) -> ParseResult:
+    def parse(
+        self,
+        html: str,
+        tree: Optional["lxml.html.HtmlElement"] = None,
+    ) -> ParseResult:
         result = ParseResult()
         ops = Operations()
         snow = Snow()
 
         try:
-            soup = BeautifulSoup(html, "lxml")
-            text = soup.get_text(separator=" ")
-            text = re.sub(r"\s+", " ", text)
+            root = tree if tree is not None else parse_html(html)
+            text = _WS_RE.sub(" ", " ".join(root.itertext()))
+
+            # One XPath pulls every table row; text_content() collapses a
+            # row to text at C level, replacing the per-cell get_text walk
+            rows = root.xpath("//table//tr")
 
-            # === LIFTS ===
-            # Try table-based extraction first
+            # === LIFTS AND TRAILS ===
+            # One traversal classifies each row and feeds both tallies,
+            # extracting the row text once instead of once per pass
             lifts_open = 0
             lifts_total = 0
+            trails_open = 0
+            trails_total = 0
 
-            # Look for lift status tables
-            tables = soup.find_all("table")
-            for table in tables:
-                rows = table.find_all("tr")
-                for row in rows:
-                    cells = row.find_all(["td", "th"])
-                    row_text = " ".join(c.get_text(strip=True).lower() for c in cells)
+            for row in rows:
+                row_text = row.text_content().lower()
 
-                    # Check if this looks like a lift row
-                    if any(lift in row_text for lift in ["chair", "lift", "carpet"]):
-                        lifts_total += 1
-                        if "open" in row_text or "yes" in row_text:
-                            lifts_open += 1
+                # Check if this looks like a lift row
+                if _LIFT_KW_RE.search(row_text):
+                    lifts_total += 1
+                    if _LIFT_OPEN_RE.search(row_text):
+                        lifts_open += 1
+
+                # Check if this looks like a trail row (by difficulty or name)
+                if _TRAIL_KW_RE.search(row_text):
+                    # Skip header rows
+                    if "name" in row_text and "status" in row_text:
+                        continue
+                    trails_total += 1
+                    if _TRAIL_OPEN_RE.search(row_text):
+                        trails_open += 1
 
             if lifts_total > 0:
                 ops.lifts_open = lifts_open
                 ops.lifts_total = lifts_total
 
-            # Fallback to text patterns if table parsing didn't work
-            if ops.lifts_open is None:
-                lift_patterns = [
-                    r"(\d+)\s*(?:of|/)\s*(\d+)\s*lifts?\s*(?:open|running)",
-                    r"lifts?\s*(?:open)?[:\s]*(\d+)\s*(?:of|/)\s*(\d+)",
-                    r"(\d+)\s*/\s*(\d+)\s*lifts?",
-                ]
-                for pattern in lift_patterns:
-                    match = re.search(pattern, text, re.IGNORECASE)
-                    if match:
-                        ops.lifts_open = int(match.group(1))
-                        ops.lifts_total = int(match.group(2))
-                        break
-
-            # === TRAILS ===
-            # Try table-based extraction
-            trails_open = 0
-            trails_total = 0
-
-            for table in tables:
-                rows = table.find_all("tr")
-                for row in rows:
-                    cells = row.find_all(["td", "th"])
-                    row_text = " ".join(c.get_text(strip=True).lower() for c in cells)
-
-                    # Check if this looks like a trail row (by difficulty or name)
-                    if any(diff in row_text for diff in ["green", "blue", "black", "diamond", "run", "trail"]):
-                        # Skip header rows
-                        if "name" in row_text and "status" in row_text:
-                            continue
-                        trails_total += 1
-                        if "open" in row_text or "groomed" in row_text:
-                            trails_open += 1
-
             if trails_total > 0:
                 ops.trails_open = trails_open
                 ops.trails_total = trails_total
 
-            # Fallback to text patterns
-            if ops.trails_open is None:
-                trail_patterns = [
-                    r"(\d+)\s*(?:of|/)\s*(\d+)\s*(?:trails?|runs?)\s*(?:open|groomed)",
-                    r"(?:trails?|runs?)\s*(?:open)?[:\s]*(\d+)\s*(?:of|/)\s*(\d+)",
-                ]
-                for pattern in trail_patterns:
-                    match = re.search(pattern, text, re.IGNORECASE)
-                    if match:
-                        ops.trails_open = int(match.group(1))
-                        ops.trails_total = int(match.group(2))
-                        break
-
-            # === SNOW DATA ===
-            # New snow
-            new_snow_match = re.search(
-                r"(?:24\s*(?:hr|hour)|new\s*snow|overnight|fresh)[:\s]*(\d+(?:\.\d+)?)\s*(?:in|\")",
-                text, re.IGNORECASE
-            )
-            if new_snow_match:
-                snow.new_snow_24h_in = float(new_snow_match.group(1))
-
-            # Base depth
-            base_match = re.search(
-                r"(?:base|snow\s*depth)[:\s]*(\d+(?:\.\d+)?)\s*(?:in|\")",
-                text, re.IGNORECASE
-            )
-            if base_match:
-                snow.base_depth_in = float(base_match.group(1))
-
-            # Season total
-            season_match = re.search(
-                r"(?:season|ytd)[:\s]*(\d+(?:\.\d+)?)\s*(?:in|\")",
-                text, re.IGNORECASE
-            )
-            if season_match:
-                snow.season_total_in = float(season_match.group(1))
+            # === TEXT SCAN ===
+            # One pass fills the snow fields and any counts the tables
+            # didn't provide; first hit per field wins
+            for m in _TEXT_SCAN_RE.finditer(text):
+                group = m.lastgroup
+                if group in ("lt1", "lt2", "lt3"):
+                    if ops.lifts_open is None:
+                        ops.lifts_open = int(m.group("lo" + group[2]))
+                        ops.lifts_total = int(m.group(group))
+                elif group in ("tt1", "tt2"):
+                    if ops.trails_open is None:
+                        ops.trails_open = int(m.group("to" + group[2]))
+                        ops.trails_total = int(m.group(group))
+                elif group == "s24" and snow.new_snow_24h_in is None:
+                    snow.new_snow_24h_in = float(m.group(group))
+                elif group == "base" and snow.base_depth_in is None:
+                    snow.base_depth_in = float(m.group(group))
+                elif group == "season" and snow.season_total_in is None:
+                    snow.season_total_in = float(m.group(group))
 
             # === OPEN STATUS ===
-            if "closed" in text.lower() and "season" in text.lower():
+            text_lower = text.lower()
+            if "closed" in text_lower and "season" in text_lower:
                 ops.open_flag = False
             elif ops.lifts_open is not None:
                 ops.open_flag = ops.lifts_open > 0
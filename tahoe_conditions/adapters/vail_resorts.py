@@ -3,15 +3,59 @@
 import json
 import logging
 import re
-from typing import Optional
-
-from bs4 import BeautifulSoup
+from collections import Counter
+from itertools import chain
+from typing import TYPE_CHECKING, Optional
 
+from tahoe_conditions.adapters._parsing import compile_scan, parse_html
 from tahoe_conditions.adapters.base import BaseAdapter, ParseResult
 from tahoe_conditions.models import Operations, Snow
 
+if TYPE_CHECKING:
+    import lxml.html
+
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r"\s+")
+
+# Text fallbacks for lift/trail fractions
+_LIFTS_RE = re.compile(r"(\d+)\s*/\s*(\d+)\s*Lifts?(?:\s*Open)?", re.IGNORECASE)
+_TRAILS_RE = re.compile(
+    r"(\d+)\s*/\s*(\d+)\s*(?:Trails?|Runs?)(?:\s*Open)?", re.IGNORECASE
+)
+
+# raw_decode reads one JSON value from an offset and ignores whatever
+# follows, so the embedded assignments need no delimiter regex
+_JSON_DECODER = json.JSONDecoder()
+
+# Snow fallbacks fused into one alternation; a single finditer pass
+# fills every field, dispatching on match.lastgroup with first-hit-wins
+_SNOW_FALLBACK_RE = compile_scan(
+    "(?i)"
+    r"24\s*(?:hr|hour)s?[:\s]*(?P<h24>\d+(?:\.\d+)?)"
+    r"|48\s*(?:hr|hour)s?[:\s]*(?P<h48>\d+(?:\.\d+)?)"
+    r"|base[:\s]*(?P<base>\d+(?:\.\d+)?)\s*(?:in|\")"
+    r"|season[:\s]*(?P<season>\d+(?:\.\d+)?)"
+)
+
+# "5 inches / 12 cm" string form in JSON values
+_INCH_RE = re.compile(r"(\d+(?:\.\d+)?)\s*inch", re.IGNORECASE)
+
+# Lift Status values come as ints or strings; one table maps both forms
+# to a counting bucket (0/Closed, 1/Open, 2/On-Hold, 3/Scheduled)
+_LIFT_STATUS_MAP = {
+    0: "closed",
+    1: "open",
+    2: "hold",
+    3: "scheduled",
+    "closed": "closed",
+    "open": "open",
+    "on-hold": "hold",
+    "on hold": "hold",
+    "hold": "hold",
+    "scheduled": "scheduled",
+}
+
 
 class VailResortsAdapter(BaseAdapter):
     """
@@ -23,29 +67,45 @@ class VailResortsAdapter(BaseAdapter):
     - Snow data in FR.snowReportData JSON (if available)
     """
 
-    def parse(self, html: str) -> ParseResult:
+    def parse(
+        self,
+        html: str,
+        tree: Optional["lxml.html.HtmlElement"] = None,
+    ) -> ParseResult:
         result = ParseResult()
-        ops = Operations()
-        snow = Snow()
+        # Internally-produced values; skip Pydantic field validation
+        ops = Operations.model_construct()
+        snow = Snow.model_construct()
 
         try:
-            soup = BeautifulSoup(html, "lxml")
-            text = soup.get_text(separator=" ")
-            text = re.sub(r"\s+", " ", text)
+            # The embedded JSON feeds are authoritative and cheap to pull
+            # from the raw HTML, so extract them before any DOM work
+            terrain_data = self._extract_terrain_status_json(html)
+            json_data = self._extract_snow_report_json(html)
+
+            text: Optional[str] = None
+
+            def page_text() -> str:
+                # Build the DOM and collapse its text only if a fallback
+                # actually runs; when the JSON feeds cover everything the
+                # page is never parsed as HTML at all
+                nonlocal text
+                if text is None:
+                    root = tree if tree is not None else parse_html(html)
+                    text = _WS_RE.sub(" ", " ".join(root.itertext()))
+                return text
 
             # === LIFTS - Try JSON first ===
-            terrain_data = self._extract_terrain_status_json(html)
             if terrain_data and "Lifts" in terrain_data:
-                counts = self._count_lift_statuses(terrain_data["Lifts"])
-                ops.lifts_open = counts.get("open", 0)
-                ops.lifts_scheduled = counts.get("scheduled", 0)
-                ops.lifts_total = counts.get("total", 0)
+                open_count, scheduled, _hold, total = self._count_lift_statuses(
+                    terrain_data["Lifts"]
+                )
+                ops.lifts_open = open_count
+                ops.lifts_scheduled = scheduled
+                ops.lifts_total = total
             else:
                 # Fallback: Pattern "X / Y Lifts"
-                lift_match = re.search(
-                    r"(\d+)\s*/\s*(\d+)\s*Lifts?(?:\s*Open)?",
-                    text, re.IGNORECASE
-                )
+                lift_match = _LIFTS_RE.search(page_text())
                 if lift_match:
                     ops.lifts_open = int(lift_match.group(1))
                     ops.lifts_total = int(lift_match.group(2))
@@ -53,32 +113,30 @@ class VailResortsAdapter(BaseAdapter):
             # === TRAILS - Try JSON first ===
             # Trails are inside GroomingAreas, not at top level
             if terrain_data and "GroomingAreas" in terrain_data:
-                all_trails = []
-                for area in terrain_data["GroomingAreas"]:
-                    all_trails.extend(area.get("Trails", []))
-                if all_trails:
-                    counts = self._count_trail_statuses(all_trails)
-                    ops.trails_open = counts.get("open", 0)
-                    ops.trails_scheduled = counts.get("scheduled", 0)
-                    ops.trails_total = counts.get("total", 0)
+                # Chain the per-area lists instead of copying them into
+                # one intermediate list
+                trails = chain.from_iterable(
+                    area.get("Trails", ())
+                    for area in terrain_data["GroomingAreas"]
+                )
+                open_count, scheduled, total = self._count_trail_statuses(trails)
+                if total > 0:
+                    ops.trails_open = open_count
+                    ops.trails_scheduled = scheduled
+                    ops.trails_total = total
             if ops.trails_total is None:
                 # Fallback: Pattern "X / Y Trails" or "X / Y Runs"
-                trails_matches = re.findall(
-                    r"(\d+)\s*/\s*(\d+)\s*(?:Trails?|Runs?)(?:\s*Open)?",
-                    text, re.IGNORECASE
-                )
+                trails_matches = _TRAILS_RE.findall(page_text())
                 if trails_matches:
                     ops.trails_open = int(trails_matches[0][0])
                     ops.trails_total = int(trails_matches[0][1])
 
             # === SNOW DATA ===
-            # Try to extract FR.snowReportData JSON if present
-            json_data = self._extract_snow_report_json(html)
             if json_data:
                 snow = self._parse_json_data(json_data)
             else:
                 # Fallback to HTML text parsing
-                snow = self._parse_html_fallback(text)
+                snow = self._parse_html_fallback(page_text())
 
             # === OPEN STATUS ===
             # Resort is "open" if any lifts are running OR scheduled to open
@@ -106,23 +164,11 @@ class VailResortsAdapter(BaseAdapter):
 
     def _extract_snow_report_json(self, html: str) -> Optional[dict]:
         """Extract FR.snowReportData JSON from script tags."""
-        pattern = r"FR\.snowReportData\s*=\s*(\{[^;]+\});"
-        match = re.search(pattern, html, re.DOTALL)
-
-        if match:
-            try:
-                json_str = match.group(1)
-                # Remove trailing commas before } or ]
-                json_str = re.sub(r",\s*([}\]])", r"\1", json_str)
-                return json.loads(json_str)
-            except json.JSONDecodeError as e:
-                logger.debug(f"Failed to parse FR.snowReportData: {e}")
-
-        return None
+        return self._extract_assigned_json(html, "FR.snowReportData")
 
     def _parse_json_data(self, data: dict) -> Snow:
         """Parse the FR.snowReportData structure."""
-        snow = Snow()
+        snow = Snow.model_construct()
 
         def extract_inches(value) -> Optional[float]:
             """Extract inches from various formats."""
@@ -139,7 +185,7 @@ class VailResortsAdapter(BaseAdapter):
                 return 0.0 if inches_str == "0" else None
             # Handle string format: "5 inches / 12 cm"
             if isinstance(value, str):
-                match = re.search(r"(\d+(?:\.\d+)?)\s*inch", value, re.IGNORECASE)
+                match = _INCH_RE.search(value)
                 if match:
                     return float(match.group(1))
             return None
@@ -156,94 +202,71 @@ class VailResortsAdapter(BaseAdapter):
 
     def _parse_html_fallback(self, text: str) -> Snow:
         """Fallback HTML text parsing for snow data."""
-        snow = Snow()
-
-        # 24-hour snow
-        match = re.search(r"24\s*(?:hr|hour)[s]?[:\s]*(\d+(?:\.\d+)?)", text, re.IGNORECASE)
-        if match:
-            snow.new_snow_24h_in = float(match.group(1))
-
-        # 48-hour snow
-        match = re.search(r"48\s*(?:hr|hour)[s]?[:\s]*(\d+(?:\.\d+)?)", text, re.IGNORECASE)
-        if match:
-            snow.new_snow_48h_in = float(match.group(1))
-
-        # Base depth
-        match = re.search(r"base[:\s]*(\d+(?:\.\d+)?)\s*(?:in|\")", text, re.IGNORECASE)
-        if match:
-            snow.base_depth_in = float(match.group(1))
-
-        # Season total
-        match = re.search(r"season[:\s]*(\d+(?:\.\d+)?)", text, re.IGNORECASE)
-        if match:
-            snow.season_total_in = float(match.group(1))
+        snow = Snow.model_construct()
+
+        for m in _SNOW_FALLBACK_RE.finditer(text):
+            group = m.lastgroup
+            if group == "h24" and snow.new_snow_24h_in is None:
+                snow.new_snow_24h_in = float(m.group(group))
+            elif group == "h48" and snow.new_snow_48h_in is None:
+                snow.new_snow_48h_in = float(m.group(group))
+            elif group == "base" and snow.base_depth_in is None:
+                snow.base_depth_in = float(m.group(group))
+            elif group == "season" and snow.season_total_in is None:
+                snow.season_total_in = float(m.group(group))
 
         return snow
 
     def _extract_terrain_status_json(self, html: str) -> Optional[dict]:
         """Extract FR.TerrainStatusFeed JSON from script tags."""
-        pattern = r"FR\.TerrainStatusFeed\s*=\s*(\{[^;]+\});"
-        match = re.search(pattern, html, re.DOTALL)
-
-        if match:
-            try:
-                json_str = match.group(1)
-                # Remove trailing commas before } or ]
-                json_str = re.sub(r",\s*([}\]])", r"\1", json_str)
-                return json.loads(json_str)
-            except json.JSONDecodeError as e:
-                logger.debug(f"Failed to parse FR.TerrainStatusFeed: {e}")
+        return self._extract_assigned_json(html, "FR.TerrainStatusFeed")
 
+    @staticmethod
+    def _extract_assigned_json(html: str, sentinel: str) -> Optional[dict]:
+        """Decode the JSON object assigned to a FR.* script variable.
+
+        str.find locates the sentinel and the opening brace; raw_decode
+        then reads exactly one balanced value and stops, so no regex has
+        to guess where the object ends and trailing script text is fine.
+        """
+        idx = html.find(sentinel)
+        if idx < 0:
+            return None
+        start = html.find("{", idx)
+        if start < 0:
+            return None
+        try:
+            data, _ = _JSON_DECODER.raw_decode(html, start)
+            return data
+        except json.JSONDecodeError as e:
+            logger.debug(f"Failed to parse {sentinel}: {e}")
         return None
 
-    def _count_lift_statuses(self, lifts: list) -> dict:
-        """Count lifts by status.
+    def _count_lift_statuses(self, lifts: list) -> tuple[int, int, int, int]:
+        """Count lifts by status via the shared status table.
 
-        Status values can be numeric or string:
-        - 0 or "Closed" = Closed
-        - 1 or "Open" = Open
-        - 2 or "On-Hold" = On Hold
-        - 3 or "Scheduled" = Scheduled
+        Returns (open, scheduled, hold, total).
         """
-        counts = {"open": 0, "scheduled": 0, "closed": 0, "hold": 0, "total": 0}
-
-        for lift in lifts:
-            status = lift.get("Status", 0)
-            counts["total"] += 1
-
-            # Handle both numeric and string status
-            if isinstance(status, int):
-                if status == 1:
-                    counts["open"] += 1
-                elif status == 3:
-                    counts["scheduled"] += 1
-                elif status == 2:
-                    counts["hold"] += 1
-                else:  # 0 or other
-                    counts["closed"] += 1
-            else:
-                status_str = str(status).lower()
-                if status_str == "open":
-                    counts["open"] += 1
-                elif status_str == "scheduled":
-                    counts["scheduled"] += 1
-                elif status_str in ("on-hold", "on hold", "hold"):
-                    counts["hold"] += 1
-                else:
-                    counts["closed"] += 1
-
-        return counts
-
-    def _count_trail_statuses(self, trails: list) -> dict:
-        """Count trails by status (uses IsOpen boolean)."""
-        counts = {"open": 0, "scheduled": 0, "closed": 0, "total": 0}
-
+        c = Counter(
+            _LIFT_STATUS_MAP.get(
+                status if isinstance(status, int) else str(status).lower(),
+                "closed",
+            )
+            for status in (lift.get("Status", 0) for lift in lifts)
+        )
+        return c["open"], c["scheduled"], c["hold"], len(lifts)
+
+    def _count_trail_statuses(self, trails) -> tuple[int, int, int]:
+        """Count trails by status (uses IsOpen boolean).
+
+        Accepts any iterable and tallies in one pass; returns
+        (open, scheduled, total) with scheduled always 0 since trails
+        only carry an IsOpen flag.
+        """
+        total = 0
+        open_count = 0
         for trail in trails:
-            counts["total"] += 1
-            # Trails use IsOpen boolean instead of Status
+            total += 1
             if trail.get("IsOpen", False):
-                counts["open"] += 1
-            else:
-                counts["closed"] += 1
-
-        return counts
+                open_count += 1
+        return open_count, 0, total
@@ -1,15 +1,20 @@
 """HTTP utilities with caching, retries, and rate limiting."""
 
+import atexit
+import functools
 import hashlib
+import itertools
 import json
 import logging
+import os
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
-from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -30,6 +35,47 @@ from tahoe_conditions.config import (
 
 logger = logging.getLogger(__name__)
 
+# Optional: orjson decodes the multi-KB NWS payloads several times
+# faster than stdlib json (it's in the "speed" extra). Its decode error
+# subclasses json.JSONDecodeError, so existing handlers still match.
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Optional: zstd-compressed cache entries cut the disk footprint of
+# multi-hundred-KB resort pages several-fold. Compressed entries get a
+# .zst filename, so mixed installs never read the wrong format.
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# ZstdCompressor/ZstdDecompressor objects are reusable but don't allow
+# simultaneous calls, and the cache helpers run from the update
+# pipeline's thread pool — so keep one pair per thread, like the lxml
+# parser in adapters/_parsing.py.
+_zstd_local = threading.local()
+
+
+def _zstd_compressor() -> "zstandard.ZstdCompressor":
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=3)
+    return compressor
+
+
+def _zstd_decompressor() -> "zstandard.ZstdDecompressor":
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor
+
+
 # Check if Playwright is available
 try:
     from playwright.sync_api import sync_playwright
@@ -38,20 +84,82 @@ except ImportError:
     HAS_PLAYWRIGHT = False
     logger.debug("Playwright not installed - headless fetching disabled")
 
-# Track last request time per host for rate limiting
+# One shared session keeps connections alive across fetches, so each
+# host pays its TCP+TLS handshake once per run instead of per request.
+# requests.Session is thread-safe for the GETs made here.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# Playwright's sync API objects are bound to the thread that created
+# them, so each worker thread lazily launches one browser and reuses it
+# across its headless fetches; all of them are torn down at exit.
+_browser_local = threading.local()
+_browsers: list = []
+_browsers_lock = threading.Lock()
+
+
+def _get_browser():
+    """Return this thread's persistent Chromium instance, launching once."""
+    browser = getattr(_browser_local, "browser", None)
+    if browser is None:
+        playwright = sync_playwright().start()
+        browser = playwright.chromium.launch(headless=True)
+        _browser_local.browser = browser
+        with _browsers_lock:
+            _browsers.append((playwright, browser))
+    return browser
+
+
+def _close_browsers() -> None:
+    with _browsers_lock:
+        for playwright, browser in _browsers:
+            try:
+                browser.close()
+                playwright.stop()
+            except Exception:
+                pass
+        _browsers.clear()
+
+
+atexit.register(_close_browsers)
+
+# In-process layer over the disk cache: entries are (stored_at, text)
+# with stored_at on the monotonic clock, and readers apply their own
+# TTL just as they would against the file mtime
+_MEM_CACHE: dict[Path, tuple[float, str]] = {}
+_mem_cache_lock = threading.Lock()
+
+# Track last request time per host for rate limiting; guarded by a lock
+# now that resorts are fetched from worker threads
 _last_request_time: dict[str, float] = {}
+_rate_limit_lock = threading.Lock()
 
 
+@functools.lru_cache(maxsize=256)
 def _get_cache_path(url: str, cache_key_suffix: str = "") -> Path:
-    """Generate cache file path for a URL."""
-    url_hash = hashlib.md5(url.encode()).hexdigest()[:16]
+    """Generate cache file path for a URL.
+
+    Memoized: URLs repeat within a run (retries, JSON and HTML for the
+    same resort) and the date key is constant for the lifetime of one
+    short-lived update process.
+    """
+    url_hash = hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
     date_key = datetime.now(timezone.utc).strftime("%Y%m%d")
     filename = f"{date_key}_{url_hash}{cache_key_suffix}.cache"
+    if HAS_ZSTD:
+        filename += ".zst"
     return CACHE_DIR / filename
 
 
 def _read_cache(cache_path: Path, ttl_seconds: int) -> Optional[str]:
     """Read from cache if valid and not expired."""
+    now = time.monotonic()
+    with _mem_cache_lock:
+        entry = _MEM_CACHE.get(cache_path)
+    if entry is not None and now - entry[0] <= ttl_seconds:
+        return entry[1]
+
     if not cache_path.exists():
         return None
 
@@ -60,35 +168,76 @@ def _read_cache(cache_path: Path, ttl_seconds: int) -> Optional[str]:
         age = time.time() - stat.st_mtime
         if age > ttl_seconds:
             return None
-        return cache_path.read_text(encoding="utf-8")
+        raw = cache_path.read_bytes()
+        if cache_path.suffix == ".zst":
+            raw = _zstd_decompressor().decompress(raw)
+        content = raw.decode("utf-8")
+        with _mem_cache_lock:
+            _MEM_CACHE[cache_path] = (now - age, content)
+        return content
     except Exception as e:
-        logger.debug(f"Cache read error: {e}")
+        logger.debug("Cache read error: %s", e)
         return None
 
 
-def _write_cache(cache_path: Path, content: str) -> None:
-    """Write content to cache."""
+# Temp names carry pid + counter so two writers of the same cache entry
+# (pooled threads racing on a shared URL, or overlapping runs) never
+# truncate each other's in-flight temp file
+_CACHE_TMP_COUNTER = itertools.count()
+
+
+def _write_cache(cache_path: Path, content: str | bytes) -> None:
+    """Write content to cache atomically."""
     try:
         cache_path.parent.mkdir(parents=True, exist_ok=True)
-        cache_path.write_text(content, encoding="utf-8")
+        if isinstance(content, str):
+            text = content
+            data = content.encode("utf-8")
+        else:
+            text = content.decode("utf-8")
+            data = content
+        if HAS_ZSTD:
+            data = _zstd_compressor().compress(data)
+        # Write a sibling then rename, so a concurrent run never reads
+        # a half-written cache file
+        tmp = cache_path.with_suffix(
+            cache_path.suffix + f".{os.getpid()}_{next(_CACHE_TMP_COUNTER)}.tmp"
+        )
+        tmp.write_bytes(data)
+        os.replace(tmp, cache_path)
+        with _mem_cache_lock:
+            _MEM_CACHE[cache_path] = (time.monotonic(), text)
     except Exception as e:
-        logger.debug(f"Cache write error: {e}")
+        logger.debug("Cache write error: %s", e)
+
+
+@functools.lru_cache(maxsize=128)
+def _url_host(url: str) -> str:
+    """Extract the host of an http(s) URL without a full urlparse."""
+    try:
+        return url.split("/", 3)[2]
+    except IndexError:
+        return url
 
 
 def _rate_limit(url: str) -> None:
     """Enforce rate limiting per host."""
-    host = urlparse(url).netloc
-    now = time.time()
-    last = _last_request_time.get(host, 0)
-    elapsed = now - last
-
-    if elapsed < RATE_LIMIT_DELAY:
-        sleep_time = RATE_LIMIT_DELAY - elapsed
-        logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s for {host}")
+    host = _url_host(url)
+
+    with _rate_limit_lock:
+        # Monotonic clock: pacing should not jump with NTP adjustments
+        now = time.monotonic()
+        last = _last_request_time.get(host, 0)
+        # Reserve this request's slot before sleeping so concurrent
+        # callers hitting the same host queue behind it
+        start = max(now, last + RATE_LIMIT_DELAY)
+        _last_request_time[host] = start
+        sleep_time = start - now
+
+    if sleep_time > 0:
+        logger.debug("Rate limiting: sleeping %.2fs for %s", sleep_time, host)
         time.sleep(sleep_time)
 
-    _last_request_time[host] = time.time()
-
 
 class FetchError(Exception):
     """Error fetching URL."""
@@ -103,7 +252,7 @@ class FetchError(Exception):
 )
 def _fetch_with_retry(url: str, headers: dict) -> requests.Response:
     """Fetch URL with retry logic."""
-    response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    response = _SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
 
     # Retry on 5xx errors
     if 500 <= response.status_code < 600:
@@ -139,7 +288,7 @@ def fetch(
     if use_cache:
         cached = _read_cache(cache_path, ttl_seconds)
         if cached is not None:
-            logger.debug(f"Cache hit: {url}")
+            logger.debug("Cache hit: %s", url)
             return cached
 
     # Rate limit
@@ -152,7 +301,7 @@ def fetch(
     }
 
     try:
-        logger.debug(f"Fetching: {url}")
+        logger.debug("Fetching: %s", url)
         response = _fetch_with_retry(url, headers)
         response.raise_for_status()
         content = response.text
@@ -186,9 +335,9 @@ def fetch_json(url: str, ttl_seconds: int = NWS_CACHE_TTL) -> dict:
     # Try cache first
     cached = _read_cache(cache_path, ttl_seconds)
     if cached is not None:
-        logger.debug(f"Cache hit (JSON): {url}")
+        logger.debug("Cache hit (JSON): %s", url)
         try:
-            return json.loads(cached)
+            return _loads(cached)
         except json.JSONDecodeError:
             pass  # Cache corrupted, refetch
 
@@ -201,13 +350,15 @@ def fetch_json(url: str, ttl_seconds: int = NWS_CACHE_TTL) -> dict:
     }
 
     try:
-        logger.debug(f"Fetching JSON: {url}")
+        logger.debug("Fetching JSON: %s", url)
         response = _fetch_with_retry(url, headers)
         response.raise_for_status()
-        data = response.json()
+        content = response.text
+        data = _loads(content)
 
-        # Cache successful response
-        _write_cache(cache_path, json.dumps(data))
+        # Cache the body as received; re-serializing the parsed dict
+        # would be a second full pass for no benefit
+        _write_cache(cache_path, content)
 
         return data
 
@@ -253,20 +404,20 @@ def fetch_headless(
     if use_cache:
         cached = _read_cache(cache_path, ttl_seconds)
         if cached is not None:
-            logger.debug(f"Cache hit (headless): {url}")
+            logger.debug("Cache hit (headless): %s", url)
             return cached
 
     # Rate limit
     _rate_limit(url)
 
     try:
-        logger.debug(f"Fetching (headless): {url}")
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent=USER_AGENT,
-                viewport={"width": 1280, "height": 720},
-            )
+        logger.debug("Fetching (headless): %s", url)
+        browser = _get_browser()
+        context = browser.new_context(
+            user_agent=USER_AGENT,
+            viewport={"width": 1280, "height": 720},
+        )
+        try:
             page = context.new_page()
 
             # Navigate and wait for content
@@ -276,13 +427,14 @@ def fetch_headless(
                 try:
                     page.wait_for_selector(wait_for_selector, timeout=wait_timeout)
                 except Exception as e:
-                    logger.warning(f"Selector wait timeout for {wait_for_selector}: {e}")
+                    logger.warning("Selector wait timeout for %s: %s", wait_for_selector, e)
 
             # Give JS a moment to finish rendering
             page.wait_for_timeout(1000)
 
             content = page.content()
-            browser.close()
+        finally:
+            context.close()
 
         # Cache successful response
         if use_cache:
@@ -3,6 +3,7 @@
 import argparse
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from tahoe_conditions.adapters import get_adapter, requires_headless
@@ -47,8 +48,10 @@ def process_resort(resort_config) -> ResortConditions:
 
     now = datetime.now(timezone.utc)
     stale = False
-    ops = Operations()
-    snow = Snow()
+    # These are filled from trusted, internally-produced data, so skip
+    # Pydantic validation; the YAML-load boundary still validates
+    ops = Operations.model_construct()
+    snow = Snow.model_construct()
 
     # Fetch and parse conditions
     try:
@@ -67,7 +70,7 @@ def process_resort(resort_config) -> ResortConditions:
             result = None
         else:
             adapter = get_adapter(resort_config.kind)
-            result = adapter.parse(html)
+            result = adapter.parse_cached(html)
 
         if result and result.success:
             ops = result.ops
@@ -110,7 +113,7 @@ def process_resort(resort_config) -> ResortConditions:
         weather_forecast_url=forecast_url,
     )
 
-    return ResortConditions(
+    return ResortConditions.model_construct(
         slug=slug,
         name=resort_config.name,
         fetched_at_utc=now,
@@ -122,6 +125,21 @@ def process_resort(resort_config) -> ResortConditions:
     )
 
 
+def _process_resort_safe(config) -> ResortConditions:
+    """process_resort with failures downgraded to a stale entry."""
+    try:
+        return process_resort(config)
+    except Exception as e:
+        logger.exception(f"Unexpected error processing {config.slug}: {e}")
+        return ResortConditions(
+            slug=config.slug,
+            name=config.name,
+            fetched_at_utc=datetime.now(timezone.utc),
+            stale=True,
+            sources=Sources(ops_url=config.source_url),
+        )
+
+
 def update_command(args) -> int:
     """Run the update pipeline."""
     setup_logging(args.verbose)
@@ -134,28 +152,21 @@ def update_command(args) -> int:
         logger.error("No enabled resorts found in registry")
         return 1
 
-    # Process each resort
-    results = []
-    for config in resorts_config:
-        try:
-            conditions = process_resort(config)
-            results.append(conditions)
-        except Exception as e:
-            logger.exception(f"Unexpected error processing {config.slug}: {e}")
-            # Create a stale entry
-            results.append(ResortConditions(
-                slug=config.slug,
-                name=config.name,
-                fetched_at_utc=datetime.now(timezone.utc),
-                stale=True,
-                sources=Sources(ops_url=config.source_url),
-            ))
+    # Process resorts concurrently: the work is I/O-bound network
+    # fetching, and per-host pacing still happens inside http.py.
+    # executor.map keeps results in config order for stable output.
+    max_workers = min(8, len(resorts_config))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_process_resort_safe, resorts_config))
+
+    # One timestamp snapshot so summary.json and latest.json agree
+    now_utc = datetime.now(timezone.utc)
 
     # Generate summary
-    summary = generate_summary(results)
+    summary = generate_summary(results, now_utc=now_utc)
 
     # Write outputs
-    write_all_outputs(results, summary)
+    write_all_outputs(results, summary, now_utc=now_utc)
 
     # Log summary
     logger.info(f"Update complete: {summary.counts.open_resorts} open, "
@@ -1,9 +1,11 @@
 """Atomic JSON output writer with last-known-good fallback."""
 
+import itertools
 import json
 import logging
 import os
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -15,6 +17,14 @@ from tahoe_conditions.models import ResortConditions, Summary
 
 logger = logging.getLogger(__name__)
 
+# Optional: orjson serializes datetimes natively in Rust, skipping the
+# per-value DateTimeEncoder.default hook (it's in the "speed" extra)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """JSON encoder that handles datetime objects."""
@@ -25,47 +35,102 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
-def write_json_atomic(path: Path, data: dict | list | BaseModel) -> None:
-    """
-    Write JSON atomically using temp file + rename.
+# Stdlib-fallback encoders, built once instead of per json.dumps call.
+# ensure_ascii=False writes UTF-8 directly, matching orjson's output.
+_ENCODER = DateTimeEncoder(separators=(",", ":"), ensure_ascii=False)
+_PRETTY_ENCODER = DateTimeEncoder(indent=2, ensure_ascii=False)
+
+
+# Temp names only need to be unique within this process; pid + counter
+# is enough and skips mkstemp's random-name O_EXCL retry loop
+_TMP_COUNTER = itertools.count()
+
+# writev lands the payload and trailing newline in one syscall; not
+# available on Windows
+_HAS_WRITEV = hasattr(os, "writev")
+
+
+def _write_bytes(
+    path: Path, buf: bytes, ensure_dir: bool = True, atomic: bool = True
+) -> None:
+    """Write bytes to a file, atomically via temp file + rename by default.
 
     Args:
         path: Target path
-        data: Data to write (dict, list, or Pydantic model)
+        buf: Serialized content
+        ensure_dir: Create the parent directory if needed. Batch callers
+            that have already created it pass False to skip the stat.
+        atomic: Write through a temp file and rename so readers never
+            see a partial file. Files that are only read on startup can
+            pass False and skip the rename.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
+    if ensure_dir:
+        path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Convert Pydantic models to dict
-    if isinstance(data, BaseModel):
-        json_data = data.model_dump(mode="json")
+    if atomic:
+        # Write to temp file in same directory (for atomic rename)
+        target = path.parent / f".{path.stem}_{os.getpid()}_{next(_TMP_COUNTER)}.tmp"
     else:
-        json_data = data
-
-    # Write to temp file in same directory (for atomic rename)
-    fd, temp_path = tempfile.mkstemp(
-        dir=path.parent,
-        prefix=f".{path.stem}_",
-        suffix=".tmp"
-    )
+        target = path
+    fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
 
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(json_data, f, indent=2, cls=DateTimeEncoder)
-            f.write("\n")
-
-        # Atomic rename
-        os.replace(temp_path, path)
+        try:
+            if _HAS_WRITEV:
+                os.writev(fd, [buf, b"\n"])
+            else:
+                os.write(fd, buf + b"\n")
+        finally:
+            os.close(fd)
+
+        if atomic:
+            os.replace(target, path)
         logger.debug(f"Wrote {path}")
 
     except Exception:
         # Clean up temp file on error
-        try:
-            os.unlink(temp_path)
-        except OSError:
-            pass
+        if atomic:
+            try:
+                os.unlink(target)
+            except OSError:
+                pass
         raise
 
 
+def write_json_atomic(
+    path: Path,
+    data: dict | list | BaseModel,
+    ensure_dir: bool = True,
+    atomic: bool = True,
+    pretty: bool = False,
+) -> None:
+    """
+    Write JSON atomically using temp file + rename.
+
+    Pydantic models serialize through pydantic-core's Rust encoder
+    without a dict round-trip; plain data goes through orjson when
+    available, else stdlib json.
+
+    Args:
+        path: Target path
+        data: Data to write (dict, list, or Pydantic model)
+        ensure_dir: Create the parent directory if needed
+        atomic: Write through a temp file + rename (see _write_bytes)
+        pretty: Indent the output. The files are machine-consumed, so
+            compact is the default; indentation roughly doubles the
+            bytes written and slows the serializers.
+    """
+    if isinstance(data, BaseModel):
+        buf = data.model_dump_json(indent=2 if pretty else None).encode("utf-8")
+    elif HAS_ORJSON:
+        buf = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    else:
+        encoder = _PRETTY_ENCODER if pretty else _ENCODER
+        buf = encoder.encode(data).encode("utf-8")
+
+    _write_bytes(path, buf, ensure_dir=ensure_dir, atomic=atomic)
+
+
 def load_existing_resort(slug: str) -> Optional[ResortConditions]:
     """
     Load existing resort data for last-known-good fallback.
@@ -78,45 +143,95 @@ def load_existing_resort(slug: str) -> Optional[ResortConditions]:
     """
     path = RESORTS_OUTPUT_DIR / f"{slug}.json"
 
-    if not path.exists():
-        return None
-
+    # Open directly instead of stat-then-open; a missing file is the
+    # common case for a resort that has never been written
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return ResortConditions(**data)
+        if HAS_ORJSON:
+            with open(path, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        # model_validate skips the kwargs-expansion layer; validation is
+        # kept since the file may have been edited or written by an
+        # older version of the schema
+        return ResortConditions.model_validate(data)
+    except FileNotFoundError:
+        return None
     except Exception as e:
         logger.warning(f"Failed to load existing data for {slug}: {e}")
         return None
 
 
-def write_resort(resort: ResortConditions) -> None:
+def _write_resort_bytes(slug: str, buf: bytes, ensure_dir: bool = True) -> None:
+    """Write one resort's serialized JSON to its per-slug file."""
+    path = RESORTS_OUTPUT_DIR / f"{slug}.json"
+
+    # Skip the write when the serialized content hasn't changed since
+    # the last run; the files are small so the read is cheaper than the
+    # write. _write_bytes appends the newline.
+    try:
+        if path.read_bytes() == buf + b"\n":
+            logger.debug(f"Unchanged, skipping {path}")
+            return
+    except OSError:
+        pass
+
+    # Per-resort files are only read at startup for fallback, so nothing
+    # reads them mid-run and the temp-file/rename pair isn't needed
+    _write_bytes(path, buf, ensure_dir=ensure_dir, atomic=False)
+
+
+def write_resort(resort: ResortConditions, ensure_dir: bool = True) -> None:
     """
     Write individual resort JSON file.
 
     Args:
         resort: Resort conditions
+        ensure_dir: Create the output directory if needed
     """
-    path = RESORTS_OUTPUT_DIR / f"{resort.slug}.json"
-    write_json_atomic(path, resort)
+    _write_resort_bytes(
+        resort.slug, resort.model_dump_json().encode("utf-8"), ensure_dir=ensure_dir
+    )
 
 
-def write_latest(resorts: list[ResortConditions]) -> None:
+def _write_latest_from_bufs(
+    bufs: list[bytes],
+    now_utc: Optional[datetime] = None,
+) -> None:
+    """Write latest.json by splicing already-serialized resort JSON.
+
+    The per-resort writers serialize each resort once; joining those
+    same byte strings here keeps latest.json to a header's worth of
+    extra encoding instead of re-dumping every model.
+    """
+    path = OUTPUT_DIR / "latest.json"
+    stamp = (now_utc or datetime.now(timezone.utc)).isoformat()
+
+    payload = b"".join([
+        b'{"generated_at_utc":"', stamp.encode("utf-8"),
+        b'","resorts":[', b",".join(bufs), b"]}",
+    ])
+
+    _write_bytes(path, payload)
+    logger.info(f"Wrote {path} with {len(bufs)} resorts")
+
+
+def write_latest(
+    resorts: list[ResortConditions],
+    now_utc: Optional[datetime] = None,
+) -> None:
     """
     Write latest.json with all resorts.
 
     Args:
         resorts: List of all resort conditions
+        now_utc: Timestamp to stamp the file with; the driver passes one
+            snapshot so latest.json and summary.json agree
     """
-    path = OUTPUT_DIR / "latest.json"
-
-    data = {
-        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
-        "resorts": [r.model_dump(mode="json") for r in resorts],
-    }
-
-    write_json_atomic(path, data)
-    logger.info(f"Wrote {path} with {len(resorts)} resorts")
+    _write_latest_from_bufs(
+        [r.model_dump_json().encode("utf-8") for r in resorts], now_utc
+    )
 
 
 def write_summary(summary: Summary) -> None:
@@ -131,22 +246,35 @@ def write_summary(summary: Summary) -> None:
     logger.info(f"Wrote {path}")
 
 
-def write_all_outputs(resorts: list[ResortConditions], summary: Summary) -> None:
+def write_all_outputs(
+    resorts: list[ResortConditions],
+    summary: Summary,
+    now_utc: Optional[datetime] = None,
+) -> None:
     """
     Write all output files.
 
     Args:
         resorts: List of resort conditions
         summary: Summary object
+        now_utc: Timestamp for latest.json
     """
-    # Ensure directories exist
+    # Ensure directories exist once up front; the per-file writers can
+    # then skip their own mkdir stat
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     RESORTS_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Write individual resort files
-    for resort in resorts:
-        write_resort(resort)
+    # Serialize each resort exactly once; the per-resort files and
+    # latest.json share the same byte strings
+    slugs = [r.slug for r in resorts]
+    bufs = [r.model_dump_json().encode("utf-8") for r in resorts]
+
+    # Per-resort files are independent; a small pool overlaps the
+    # file syscalls across resorts
+    max_workers = min(8, len(resorts))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(partial(_write_resort_bytes, ensure_dir=False), slugs, bufs))
 
     # Write aggregated files
-    write_latest(resorts)
+    _write_latest_from_bufs(bufs, now_utc=now_utc)
     write_summary(summary)
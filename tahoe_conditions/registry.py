@@ -1,16 +1,64 @@
 """Load resort configurations from YAML registry."""
 
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+# libyaml's C parser loads the registry ~10-20x faster than the pure
+# Python SafeLoader; fall back when PyYAML was built without libyaml.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 from tahoe_conditions.config import RESORTS_YAML
 from tahoe_conditions.models import ResortConfig
 
 logger = logging.getLogger(__name__)
 
+# Validated configs keyed by raw entry contents; validation is pure on
+# its input, so long-lived processes that reload an unchanged registry
+# skip Pydantic entirely. Bounded like the adapter parse caches.
+_CFG_CACHE: "OrderedDict[tuple, ResortConfig]" = OrderedDict()
+_CFG_CACHE_MAX = 128
+
+
+def _build_config(item: dict) -> Optional[ResortConfig]:
+    """Validate one raw registry entry, memoized on its field values.
+
+    Returns the shared cached instance on hit (callers treat configs as
+    read-only). Invalid entries are logged and return None.
+    """
+    try:
+        key = tuple(sorted(item.items()))
+        # Building the tuple never raises (sorted only compares the
+        # string keys); probe the hash so nested values surface here
+        hash(key)
+    except TypeError:
+        # Unhashable value (nested structure); validate without caching
+        key = None
+
+    if key is not None:
+        cached = _CFG_CACHE.get(key)
+        if cached is not None:
+            _CFG_CACHE.move_to_end(key)
+            return cached
+
+    try:
+        resort = ResortConfig(**item)
+    except Exception as e:
+        logger.warning(f"Invalid resort config: {item.get('slug', 'unknown')}: {e}")
+        return None
+
+    if key is not None:
+        _CFG_CACHE[key] = resort
+        if len(_CFG_CACHE) > _CFG_CACHE_MAX:
+            _CFG_CACHE.popitem(last=False)
+    return resort
+
 
 def load_resorts(yaml_path: Optional[Path] = None) -> list[ResortConfig]:
     """
@@ -28,23 +76,115 @@ def load_resorts(yaml_path: Optional[Path] = None) -> list[ResortConfig]:
         raise FileNotFoundError(f"Resort registry not found: {path}")
 
     with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_Loader)
 
     resorts = []
     for item in data.get("resorts", []):
-        try:
-            resort = ResortConfig(**item)
+        resort = _build_config(item)
+        if resort is not None:
             resorts.append(resort)
-        except Exception as e:
-            logger.warning(f"Invalid resort config: {item.get('slug', 'unknown')}: {e}")
 
     logger.info(f"Loaded {len(resorts)} resorts from registry")
     return resorts
 
 
+# Scalars YAML would load as boolean false; used to drop disabled
+# entries before they ever become dicts
+_FALSE_SCALARS = frozenset({"false", "no", "off"})
+
+
+class _StreamShape(Exception):
+    """Registry file doesn't have the flat shape the fast path expects."""
+
+
+def _iter_enabled_items(stream):
+    """Yield raw field dicts for enabled resorts from the YAML event stream.
+
+    Walks parser events instead of constructing the whole document, so
+    disabled resorts are skipped without materializing their fields.
+    Only the registry's actual layout is handled — a top-level mapping
+    whose ``resorts`` key holds a sequence of flat scalar mappings;
+    anything else raises _StreamShape so the caller can fall back to the
+    full loader. Field values are left as strings for Pydantic to coerce.
+    """
+    depth = 0
+    in_resorts = False
+    pending_resorts_key = False
+    current = None
+    key = None
+
+    for event in yaml.parse(stream, Loader=_Loader):
+        if isinstance(event, yaml.ScalarEvent):
+            if current is not None:
+                if key is None:
+                    key = event.value
+                else:
+                    current[key] = event.value
+                    key = None
+            elif depth == 1:
+                # Top-level keys and values alternate here; only a key
+                # scalar can be immediately followed by the sequence
+                pending_resorts_key = event.value == "resorts"
+        elif isinstance(event, yaml.MappingStartEvent):
+            depth += 1
+            if current is not None:
+                raise _StreamShape("nested mapping in resort entry")
+            if in_resorts and depth == 3:
+                current = {}
+                key = None
+        elif isinstance(event, yaml.MappingEndEvent):
+            depth -= 1
+            if current is not None and depth == 2:
+                if current.get("enabled", "").lower() not in _FALSE_SCALARS:
+                    yield current
+                current = None
+        elif isinstance(event, yaml.SequenceStartEvent):
+            depth += 1
+            if current is not None:
+                raise _StreamShape("nested sequence in resort entry")
+            if pending_resorts_key and depth == 2:
+                in_resorts = True
+                pending_resorts_key = False
+        elif isinstance(event, yaml.SequenceEndEvent):
+            depth -= 1
+            if depth == 1:
+                in_resorts = False
+        elif isinstance(event, yaml.AliasEvent):
+            raise _StreamShape("alias in registry")
+
+
+def load_resorts_streaming(yaml_path: Optional[Path] = None) -> list[ResortConfig]:
+    """
+    Load only enabled resorts, streaming the YAML event-by-event.
+
+    Skips building Python objects for disabled entries. Raises
+    _StreamShape (or yaml.YAMLError) if the file doesn't have the
+    expected flat layout; get_enabled_resorts falls back to
+    load_resorts in that case.
+    """
+    path = yaml_path or RESORTS_YAML
+
+    if not path.exists():
+        raise FileNotFoundError(f"Resort registry not found: {path}")
+
+    resorts = []
+    with open(path, "r", encoding="utf-8") as f:
+        for item in _iter_enabled_items(f):
+            resort = _build_config(item)
+            if resort is not None:
+                resorts.append(resort)
+
+    logger.info(f"Loaded {len(resorts)} enabled resorts from registry")
+    return resorts
+
+
 def get_enabled_resorts(yaml_path: Optional[Path] = None) -> list[ResortConfig]:
     """Get only enabled resorts from registry."""
-    resorts = load_resorts(yaml_path)
-    enabled = [r for r in resorts if r.enabled]
+    try:
+        enabled = load_resorts_streaming(yaml_path)
+    except (_StreamShape, yaml.YAMLError):
+        logger.debug("Streaming registry load failed; using full loader", exc_info=True)
+        resorts = load_resorts(yaml_path)
+        enabled = [r for r in resorts if r.enabled]
     logger.info(f"{len(enabled)} resorts enabled")
     return enabled
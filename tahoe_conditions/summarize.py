@@ -1,5 +1,6 @@
 """Rule-based summarization for resort conditions."""
 
+import functools
 import logging
 from datetime import datetime, timezone
 from typing import Optional
@@ -20,42 +21,71 @@ def generate_blurb(resort: ResortConditions) -> str:
         Human-readable summary sentence
     """
     if resort.stale:
+        # Timestamps differ every run, so the stale message isn't cached
         return (
             f"Latest update unavailable; showing last known conditions "
             f"from {resort.fetched_at_utc.strftime('%Y-%m-%d %H:%M')} UTC."
         )
 
-    parts = [f"{resort.name}:"]
+    # Blurbs depend only on these fields; conditions often repeat run to
+    # run (and across generate_summary calls in long-lived processes), so
+    # memoize the string-building on the full input tuple
+    ops = resort.ops
+    snow = resort.snow
+    weather = resort.weather
+    return _render_blurb(
+        resort.name,
+        ops.lifts_open, ops.lifts_scheduled, ops.lifts_total,
+        ops.trails_open, ops.trails_scheduled, ops.trails_total,
+        snow.new_snow_24h_in, snow.base_depth_in,
+        weather.short_forecast, weather.temp_f, weather.wind_mph,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _render_blurb(
+    name: str,
+    lifts_open: Optional[int],
+    lifts_scheduled: Optional[int],
+    lifts_total: Optional[int],
+    trails_open: Optional[int],
+    trails_scheduled: Optional[int],
+    trails_total: Optional[int],
+    new_snow_24h_in: Optional[float],
+    base_depth_in: Optional[float],
+    short_forecast: Optional[str],
+    temp_f: Optional[float],
+    wind_mph: Optional[float],
+) -> str:
+    """Build a non-stale blurb from its scalar inputs."""
+    parts = [f"{name}:"]
 
     # Lift/trail status
     # Count scheduled as open for display purposes
-    ops = resort.ops
-    lifts_available = (ops.lifts_open or 0) + (ops.lifts_scheduled or 0)
-    trails_available = (ops.trails_open or 0) + (ops.trails_scheduled or 0)
-
-    if ops.lifts_total is not None:
-        parts.append(f"{lifts_available}/{ops.lifts_total} lifts")
-    if ops.trails_total is not None:
-        parts.append(f"{trails_available}/{ops.trails_total} trails.")
-    elif ops.lifts_total is not None:
+    lifts_available = (lifts_open or 0) + (lifts_scheduled or 0)
+    trails_available = (trails_open or 0) + (trails_scheduled or 0)
+
+    if lifts_total is not None:
+        parts.append(f"{lifts_available}/{lifts_total} lifts")
+    if trails_total is not None:
+        parts.append(f"{trails_available}/{trails_total} trails.")
+    elif lifts_total is not None:
         parts[-1] += "."
 
     # Snow
-    snow = resort.snow
-    if snow.new_snow_24h_in is not None:
-        parts.append(f"New snow (24h): {snow.new_snow_24h_in:.0f}\".")
-    elif snow.base_depth_in is not None:
-        parts.append(f"Base: {snow.base_depth_in:.0f}\".")
+    if new_snow_24h_in is not None:
+        parts.append(f"New snow (24h): {new_snow_24h_in:.0f}\".")
+    elif base_depth_in is not None:
+        parts.append(f"Base: {base_depth_in:.0f}\".")
 
     # Weather
-    weather = resort.weather
     weather_parts = []
-    if weather.short_forecast:
-        weather_parts.append(weather.short_forecast)
-    if weather.temp_f is not None:
-        weather_parts.append(f"{weather.temp_f:.0f}°F")
-    if weather.wind_mph is not None:
-        weather_parts.append(f"wind {weather.wind_mph:.0f} mph")
+    if short_forecast:
+        weather_parts.append(short_forecast)
+    if temp_f is not None:
+        weather_parts.append(f"{temp_f:.0f}°F")
+    if wind_mph is not None:
+        weather_parts.append(f"wind {wind_mph:.0f} mph")
 
     if weather_parts:
         parts.append("Forecast: " + ", ".join(weather_parts) + ".")
@@ -73,59 +103,96 @@ def compute_highlights(resorts: list[ResortConditions]) -> list[str]:
     Returns:
         List of highlight strings
     """
-    highlights = []
-
-    # Filter to non-stale, open resorts
-    active = [r for r in resorts if not r.stale and r.ops.open_flag]
-
-    if not active:
+    # One pass tracks the running winner for every category instead of
+    # building four filtered lists and re-scanning each with max()/min().
+    # At the registry's size (~a dozen resorts) this is faster than
+    # packing the metrics into arrays would be; revisit only if this is
+    # ever pointed at a region with hundreds of entries.
+    any_active = False
+    best_terrain = None
+    best_terrain_ratio = 0.0
+    most_snow = None
+    most_snow_val = 0.0
+    windiest = None
+    windiest_val = float("-inf")
+    coldest = None
+    coldest_val = float("inf")
+
+    for r in resorts:
+        # Only non-stale, open resorts count toward highlights
+        if r.stale or not r.ops.open_flag:
+            continue
+        any_active = True
+        ops = r.ops
+        snow = r.snow
+        weather = r.weather
+
+        if ops.trails_open and ops.trails_total:
+            ratio = ops.trails_open / ops.trails_total
+            if best_terrain is None or ratio > best_terrain_ratio:
+                best_terrain = r
+                best_terrain_ratio = ratio
+
+        if snow.new_snow_24h_in is not None and snow.new_snow_24h_in > 0:
+            if most_snow is None or snow.new_snow_24h_in > most_snow_val:
+                most_snow = r
+                most_snow_val = snow.new_snow_24h_in
+
+        if weather.wind_mph is not None:
+            if windiest is None or weather.wind_mph > windiest_val:
+                windiest = r
+                windiest_val = weather.wind_mph
+
+        if weather.temp_f is not None:
+            if coldest is None or weather.temp_f < coldest_val:
+                coldest = r
+                coldest_val = weather.temp_f
+
+    if not any_active:
         return ["All resorts are currently closed or unavailable."]
 
+    highlights = []
+
     # Most open terrain (highest trails_open ratio)
-    with_trails = [r for r in active if r.ops.trails_open and r.ops.trails_total]
-    if with_trails:
-        best_terrain = max(with_trails, key=lambda r: r.ops.trails_open / r.ops.trails_total)
-        pct = (best_terrain.ops.trails_open / best_terrain.ops.trails_total) * 100
+    if best_terrain is not None:
+        pct = best_terrain_ratio * 100
         highlights.append(
             f"Most open terrain: {best_terrain.name} "
             f"({best_terrain.ops.trails_open}/{best_terrain.ops.trails_total} trails, {pct:.0f}%)"
         )
 
     # Most new snow (24h)
-    with_snow = [r for r in active if r.snow.new_snow_24h_in is not None and r.snow.new_snow_24h_in > 0]
-    if with_snow:
-        most_snow = max(with_snow, key=lambda r: r.snow.new_snow_24h_in)
+    if most_snow is not None:
         highlights.append(
-            f"Most new snow: {most_snow.name} ({most_snow.snow.new_snow_24h_in:.0f}\" in 24h)"
+            f"Most new snow: {most_snow.name} ({most_snow_val:.0f}\" in 24h)"
         )
 
-    # Windiest
-    with_wind = [r for r in active if r.weather.wind_mph is not None]
-    if with_wind:
-        windiest = max(with_wind, key=lambda r: r.weather.wind_mph)
-        if windiest.weather.wind_mph >= 15:  # Only highlight if notably windy
-            highlights.append(
-                f"Windiest: {windiest.name} ({windiest.weather.wind_mph:.0f} mph)"
-            )
-
-    # Coldest
-    with_temp = [r for r in active if r.weather.temp_f is not None]
-    if with_temp:
-        coldest = min(with_temp, key=lambda r: r.weather.temp_f)
-        if coldest.weather.temp_f <= 32:  # Only highlight if notably cold
-            highlights.append(
-                f"Coldest: {coldest.name} ({coldest.weather.temp_f:.0f}°F)"
-            )
+    # Windiest (only highlight if notably windy)
+    if windiest is not None and windiest_val >= 15:
+        highlights.append(
+            f"Windiest: {windiest.name} ({windiest_val:.0f} mph)"
+        )
+
+    # Coldest (only highlight if notably cold)
+    if coldest is not None and coldest_val <= 32:
+        highlights.append(
+            f"Coldest: {coldest.name} ({coldest_val:.0f}°F)"
+        )
 
     return highlights
 
 
-def generate_summary(resorts: list[ResortConditions]) -> Summary:
+def generate_summary(
+    resorts: list[ResortConditions],
+    now_utc: Optional[datetime] = None,
+) -> Summary:
     """
     Generate a complete summary from resort conditions.
 
     Args:
         resorts: List of all resort conditions
+        now_utc: Timestamp for the summary; the driver passes one
+            snapshot so summary.json and latest.json agree
 
     Returns:
         Summary object
@@ -148,7 +215,7 @@ def generate_summary(resorts: list[ResortConditions]) -> Summary:
     highlights = compute_highlights(resorts)
 
     return Summary(
-        last_updated_utc=datetime.now(timezone.utc),
+        last_updated_utc=now_utc or datetime.now(timezone.utc),
         counts=counts,
         highlights=highlights,
         blurbs=blurbs,
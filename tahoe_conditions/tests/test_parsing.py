@@ -92,6 +92,26 @@ class TestGenericAdapter:
         assert result.snow.new_snow_24h_in == 6.0
         assert result.snow.base_depth_in == 48.0
 
+    def test_parse_surface_conditions(self):
+        """Test the surface branch, which slices by match offsets."""
+        from tahoe_conditions.adapters.generic_html import GenericHTMLAdapter
+
+        html = """
+        <html>
+        <body>
+            <div>5/10 Lifts Open</div>
+            <div>Surface: Packed Powder.</div>
+        </body>
+        </html>
+        """
+
+        adapter = GenericHTMLAdapter()
+        result = adapter.parse(html)
+
+        assert result.success
+        # Original casing is preserved in the sliced text
+        assert result.snow.surface == "Packed Powder"
+
 
 class TestDiamondPeakAdapter:
     """Test Diamond Peak adapter."""
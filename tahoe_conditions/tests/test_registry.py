@@ -0,0 +1,37 @@
+"""Tests for the resort registry loaders."""
+
+from tahoe_conditions.registry import get_enabled_resorts, load_resorts
+
+
+class TestRegistryLoading:
+    """Test loading resort configs from YAML."""
+
+    def test_load_entry_with_nested_value(self, tmp_path):
+        """Entries with nested values load fine, just without caching."""
+        path = tmp_path / "resorts.yaml"
+        path.write_text(
+            "resorts:\n"
+            "  - slug: nested\n"
+            "    name: Nested\n"
+            "    kind: generic\n"
+            "    source_url: https://example.com\n"
+            "    lat: 39.0\n"
+            "    lon: -120.0\n"
+            "    enabled: true\n"
+            "    extras:\n"
+            "      a: 1\n"
+            "  - slug: plain\n"
+            "    name: Plain\n"
+            "    kind: generic\n"
+            "    source_url: https://example.com\n"
+            "    lat: 39.1\n"
+            "    lon: -120.1\n"
+            "    enabled: false\n"
+        )
+
+        resorts = load_resorts(path)
+        assert [r.slug for r in resorts] == ["nested", "plain"]
+
+        # The streaming path falls back to the full loader for this shape
+        enabled = get_enabled_resorts(path)
+        assert [r.slug for r in enabled] == ["nested"]
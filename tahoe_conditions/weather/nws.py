@@ -2,6 +2,7 @@
 
 import logging
 import re
+import time
 from typing import Optional
 
 from tahoe_conditions.config import NWS_CACHE_TTL
@@ -12,6 +13,22 @@ logger = logging.getLogger(__name__)
 
 NWS_POINTS_URL = "https://api.weather.gov/points/{lat},{lon}"
 
+# Compiled once; _parse_wind runs for every resort on every update.
+# One pattern captures speed, range upper bound, and trailing gust so a
+# single search replaces two scans of the same string.
+_WIND_RE = re.compile(
+    r"(?P<lo>\d+)\s*(?:to\s*(?P<hi>\d+))?\s*mph"
+    r"(?:.*?gust(?:ing|s)?\s*(?:to\s*)?(?P<gust>\d+)\s*mph)?",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# The points endpoint just maps coordinates to a forecast URL, and that
+# mapping is fixed per NWS grid cell (~2.5km), so coordinates rounded to
+# two decimals share an entry. Values are (monotonic stored_at,
+# forecast_url); a concurrent miss only costs a redundant fetch, so no
+# lock. fetch_json's disk cache still backs the misses.
+_POINTS_CACHE: dict[tuple[float, float], tuple[float, str]] = {}
+
 
 def _parse_wind(wind_str: Optional[str]) -> tuple[Optional[float], Optional[float]]:
     """
@@ -26,18 +43,15 @@ def _parse_wind(wind_str: Optional[str]) -> tuple[Optional[float], Optional[floa
     wind_mph = None
     wind_gust_mph = None
 
-    # Match patterns like "10 mph" or "10 to 20 mph"
-    speed_match = re.search(r"(\d+)\s*(?:to\s*(\d+))?\s*mph", wind_str, re.IGNORECASE)
-    if speed_match:
-        wind_mph = float(speed_match.group(1))
-        if speed_match.group(2):
-            # "10 to 20 mph" - use higher value as base
-            wind_mph = float(speed_match.group(2))
-
-    # Match gust pattern
-    gust_match = re.search(r"gust(?:ing|s)?\s*(?:to\s*)?(\d+)\s*mph", wind_str, re.IGNORECASE)
-    if gust_match:
-        wind_gust_mph = float(gust_match.group(1))
+    # Matches "10 mph", "10 to 20 mph", and an optional trailing
+    # "gusting to 25 mph" in one pass
+    match = _WIND_RE.search(wind_str)
+    if match:
+        # "10 to 20 mph" - use higher value as base
+        wind_mph = float(match.group("hi") or match.group("lo"))
+        gust = match.group("gust")
+        if gust:
+            wind_gust_mph = float(gust)
 
     return wind_mph, wind_gust_mph
 
@@ -57,17 +71,27 @@ def fetch_weather(lat: float, lon: float) -> tuple[Weather, Optional[str], Optio
     forecast_url = None
     weather = Weather()
 
-    try:
-        # Step 1: Get the forecast URL from points endpoint
-        logger.debug(f"Fetching NWS points: {points_url}")
-        points_data = fetch_json(points_url, ttl_seconds=NWS_CACHE_TTL)
-
-        properties = points_data.get("properties", {})
-        forecast_url = properties.get("forecast")
+    grid_key = (round(lat, 2), round(lon, 2))
 
-        if not forecast_url:
-            logger.warning(f"No forecast URL in NWS points response for {lat},{lon}")
-            return weather, points_url, None
+    try:
+        # Step 1: Get the forecast URL from points endpoint, skipping
+        # the round trip entirely when this grid cell was already looked
+        # up this run
+        cached = _POINTS_CACHE.get(grid_key)
+        if cached is not None and time.monotonic() - cached[0] <= NWS_CACHE_TTL:
+            forecast_url = cached[1]
+        else:
+            logger.debug(f"Fetching NWS points: {points_url}")
+            points_data = fetch_json(points_url, ttl_seconds=NWS_CACHE_TTL)
+
+            properties = points_data.get("properties", {})
+            forecast_url = properties.get("forecast")
+
+            if not forecast_url:
+                logger.warning(f"No forecast URL in NWS points response for {lat},{lon}")
+                return weather, points_url, None
+
+            _POINTS_CACHE[grid_key] = (time.monotonic(), forecast_url)
 
         # Step 2: Fetch the forecast
         logger.debug(f"Fetching NWS forecast: {forecast_url}")